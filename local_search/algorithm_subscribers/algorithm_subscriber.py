@@ -1,5 +1,6 @@
 from typing import Union
 from local_search.problems import Problem, State
+from local_search.problems.base.moves import Move
 
 
 class AlgorithmSubscriber:
@@ -40,6 +41,14 @@ class AlgorithmSubscriber:
         Hook to call when algorithm makes move and checks new neighbour.
         """
 
+    def on_next_move(self, model: Problem, from_state: State, move: Move) -> None:
+        """
+        Hook to call when algorithm evaluates a move without making it.
+        The neighbour is made only for subscribers that override `on_next_neighbour`.
+        """
+        if type(self).on_next_neighbour is not AlgorithmSubscriber.on_next_neighbour:
+            self.on_next_neighbour(model, from_state, move.make())
+
     def on_local_optimum_escape(self, model: Problem, from_state: State, to_state: Union[State, None]) -> None:
         """
         Hook to call when algorithm escapes local optimum. 
@@ -51,7 +51,7 @@ class GraphColoringStateDrawer(StateDrawer):
         self._draw_vertices(screen, model, state)
 
     def _draw_lines(self, screen, model: GraphColoringProblem):
-        graph = [list(model.graph[i]) for i in range(model.n_vertices)]
+        graph = [model.graph.neighbours(i).tolist() for i in range(model.n_vertices)]
         extremes = self._find_extremes()
 
         for i in range(len(graph)):
@@ -75,7 +75,7 @@ class GraphColoringStateDrawer(StateDrawer):
         for i in range(len(self.coords)):
             x, y = self._scale(self.coords[i], screen, extremes)
             pygame.draw.circle(
-                screen, colors[state.coloring[i].color], (x, y), 10)
+                screen, colors[state.colors[i]], (x, y), 10)
             pygame.draw.circle(screen, (0, 0, 0), (x, y), 10, 2)
 
     def _get_colors(self, model: GraphColoringProblem):
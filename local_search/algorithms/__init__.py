@@ -5,3 +5,4 @@ from local_search.algorithms.hill_climbing.best_choice_hill_climbing import Best
 from local_search.algorithms.hill_climbing.worst_choice_hill_climbing import WorstChoiceHillClimbing
 from local_search.algorithms.hill_climbing.random_choice_hill_climbing import RandomChoiceHillClimbing
 from local_search.algorithms.simulated_annealing import SimulatedAnnealing
+from local_search.algorithms.tabu_col import TabuCol
@@ -11,14 +11,21 @@ class BestChoiceHillClimbing(HillClimbing):
     The most known version of hill climbing.
     Algorithm works, by checking all the available moves
     and selecting the best one that improves the current state.
+    If the problem can evaluate the whole neighbourhood at once, only the best move is made.
     """
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
-        best_improving_state = state
-        for neighbour in self._get_neighbours(model, state):
-            if model.improvement(neighbour, state) > 0:
-                if best_improving_state is None:
-                    best_improving_state = neighbour
-                elif model.improvement(neighbour, best_improving_state) > 0:
-                    best_improving_state = neighbour
-        return best_improving_state
+        best_move = model.best_move(state)
+        if best_move is not None:
+            move, improvement = best_move
+            self._on_next_move(model, state, move)
+            return move.make() if improvement > 0 else state
+
+        best_improving_move, best_improvement = None, 0
+        for move in self._get_moves(model, state):
+            improvement = model.move_improvement(move)
+            if improvement > best_improvement:
+                best_improving_move, best_improvement = move, improvement
+        if best_improving_move is None:
+            return state
+        return best_improving_move.make()
@@ -0,0 +1,31 @@
+from collections import deque
+from typing import Iterable
+
+
+class DontLookBits:
+    """
+    Queue of decision variables that are worth looking at.
+
+    A variable leaves the queue when it's checked, i.e. its "don't look bit" is set,
+    and comes back only when a move changes its surroundings.
+    """
+
+    def __init__(self, variables: Iterable[int]):
+        self._queue = deque(variables)
+        self._queued = set(self._queue)
+
+    def __len__(self):
+        return len(self._queue)
+
+    def pop(self) -> int:
+        variable = self._queue.popleft()
+        self._queued.remove(variable)
+        return variable
+
+    def push(self, variable: int):
+        """
+        Clears the don't look bit of the variable
+        """
+        if variable not in self._queued:
+            self._queue.append(variable)
+            self._queued.add(variable)
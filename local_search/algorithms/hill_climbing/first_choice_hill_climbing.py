@@ -1,5 +1,7 @@
 from typing import Union
-from local_search.algorithms.hill_climbing.hill_climbing import HillClimbing
+from local_search.algorithms.hill_climbing.dont_look_bits import DontLookBits
+from local_search.algorithms.hill_climbing.hill_climbing import HCConfig, HillClimbing
+from local_search.problems.base.move_generator import LocalMoveGenerator
 from local_search.problems.base.state import State
 from local_search.problems.base.problem import Problem
 
@@ -11,10 +13,38 @@ class FirstChoiceHillClimbing(HillClimbing):
     Very basic version of hill climbing. Algorithm works, by generating one move,
     applying it to the state and checking if new state is better. 
     In case if new state is better, then algorithm select it and returns, otherwise, it tries another.
+
+    If the neighbourhood can be split into moves around single variables,
+    algorithm checks only variables from the don't look bits queue.
     """
 
+    def __init__(self, config: HCConfig = None):
+        super().__init__(config)
+        self._dont_look_bits: Union[DontLookBits, None] = None
+        self._dont_look_bits_state: Union[State, None] = None
+
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
-        for neighbour in self._get_neighbours(model, state):
-            if model.improvement(neighbour, state) > 0:
-                return neighbour
+        if isinstance(model.move_generator, LocalMoveGenerator):
+            return self._climb_with_dont_look_bits(model, state)
+        for move in self._get_moves(model, state):
+            if model.move_improvement(move) > 0:
+                return move.make()
+        return state
+
+    def _climb_with_dont_look_bits(self, model: Problem, state: State) -> Union[State, None]:
+        move_generator: LocalMoveGenerator = model.move_generator
+        if self._dont_look_bits_state is not state:
+            # state wasn't reached by climbing (e.g. it's a random restart), so every variable has to be checked
+            self._dont_look_bits = DontLookBits(
+                move_generator.variables(state))
+        self._dont_look_bits_state = state
+        while self._dont_look_bits:
+            variable = self._dont_look_bits.pop()
+            for move in self._get_moves_around(model, state, variable):
+                if model.move_improvement(move) > 0:
+                    self._dont_look_bits.push(variable)
+                    for touched_variable in move_generator.touched_variables(move):
+                        self._dont_look_bits.push(touched_variable)
+                    self._dont_look_bits_state = move.make()
+                    return self._dont_look_bits_state
         return state
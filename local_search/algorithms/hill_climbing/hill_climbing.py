@@ -13,19 +13,21 @@ from dataclasses import dataclass
 class HCEscapeStrategy(IntEnum):
     RandomRestart = 0
     Perturbation = auto()
+    Intensification = auto()
 
 @dataclass
 class HCConfig(AlgorithmConfig):
     escape_random_restart_probability: float = 0.5
     escape_perturbation_probability: float = 0.5
     escape_perturbation_size: int = 50
+    escape_intensification_probability: float = 0
 
 DEFAULT_CONFIG = HCConfig()
 
 class HillClimbing(SubscribableAlgorithm, ABC):
     """
     Template for various greedy local search algorithms.
-    Supports escaping local optima by random restarts / random perturbations
+    Supports escaping local optima by random restarts / random perturbations / problem specific intensification
     """
     def __init__(self, config: HCConfig = None):
         self.config = config or DEFAULT_CONFIG
@@ -34,6 +36,7 @@ class HillClimbing(SubscribableAlgorithm, ABC):
         self._escape_probabilities = [0 for _ in self._escape_strategies]
         self._escape_probabilities[HCEscapeStrategy.RandomRestart.value] = self.config.escape_random_restart_probability
         self._escape_probabilities[HCEscapeStrategy.Perturbation.value] = self.config.escape_perturbation_probability
+        self._escape_probabilities[HCEscapeStrategy.Intensification.value] = self.config.escape_intensification_probability
         super().__init__(config=config)
 
     def _find_next_state(self, model: Problem, state: State) -> Union[State, None]:
@@ -53,3 +56,5 @@ class HillClimbing(SubscribableAlgorithm, ABC):
             return self._random_restart(model)
         if strategy == HCEscapeStrategy.Perturbation:
             return self._perturb(model, self.config.escape_perturbation_size)
+        if strategy == HCEscapeStrategy.Intensification:
+            return self._intensify(model, state)
@@ -13,7 +13,7 @@ class RandomChoiceHillClimbing(HillClimbing):
     """
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
-        neighbour = next(self._get_random_neighbours(model, state))
-        if model.improvement(neighbour, state) > 0:
-            return neighbour
+        move = next(self._get_random_moves(model, state))
+        if model.move_improvement(move) > 0:
+            return move.make()
         return state
\ No newline at end of file
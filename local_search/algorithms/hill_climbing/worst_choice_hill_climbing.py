@@ -13,14 +13,13 @@ class WorstChoiceHillClimbing(HillClimbing):
     """
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
-        worst_improving_state = None
-        for neighbour in self._get_neighbours(model, state):
-            if model.improvement(neighbour, state) > 0:
-                if worst_improving_state is None:
-                    worst_improving_state = neighbour
-                elif model.improvement(neighbour, worst_improving_state) < 0:
-                    worst_improving_state = neighbour
+        worst_improving_move, worst_improvement = None, None
+        for move in self._get_moves(model, state):
+            improvement = model.move_improvement(move)
+            if improvement > 0:
+                if worst_improving_move is None or improvement < worst_improvement:
+                    worst_improving_move, worst_improvement = move, improvement
 
-        if worst_improving_state is None:
+        if worst_improving_move is None:
             return state
-        return worst_improving_state
+        return worst_improving_move.make()
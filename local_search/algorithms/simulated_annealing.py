@@ -13,6 +13,7 @@ class SAEscapeStrategy(IntEnum):
     RandomRestart = 0
     Perturbation = auto()
     Reheat = auto()
+    Intensification = auto()
 
 
 @dataclass
@@ -25,6 +26,7 @@ class SimulatedAnnealingConfig(AlgorithmConfig):
     escape_perturbation_size: int = 50
     escape_reheat_probability: float = 0.33
     escape_reheat_ratio: float = 0.1
+    escape_intensification_probability: float = 0
 
 
 DEFAULT_CONFIG = SimulatedAnnealingConfig()
@@ -46,38 +48,40 @@ class SimulatedAnnealing(SubscribableAlgorithm):
         self._escape_probabilities[SAEscapeStrategy.RandomRestart.value] = self.config.escape_random_restart_probability
         self._escape_probabilities[SAEscapeStrategy.Perturbation.value] = self.config.escape_perturbation_probability
         self._escape_probabilities[SAEscapeStrategy.Reheat.value] = self.config.escape_reheat_probability
+        self._escape_probabilities[SAEscapeStrategy.Intensification.value] = self.config.escape_intensification_probability
         self.cooling_time = 0
         super().__init__(config=self.config)
 
     def _find_next_state(self, model: Problem, state: State) -> Union[State, None]:
         # TODO:
-        # — find random neighbour (self._get_random_neighbours + `next` to read a single element)
-        # — if the neighbour is better then mark is as the next state
+        # — find random move (self._get_random_moves + `next` to read a single element)
+        # — calculate how much the move improves the state (model has a corresponding method)
+        # — if the move is improving then make it and mark the result as the next state
         # — otherwise calculate the probability of transition using self._calculate_transition_probability
-        #   * use random.random() to check whether the neighbor should be a new state
+        #   * use random.random() to check whether the move should be made
         # — update temperature
         # — return the new state
         next_state = state
-        neighbour = next(self._get_random_neighbours(model, state))
+        move = next(self._get_random_moves(model, state))
+        improvement = model.move_improvement(move)
 
-        if model.improvement(neighbour, state) > 0:
-            next_state = neighbour
+        if improvement > 0:
+            next_state = move.make()
         else:
             transition_probability = self._calculate_transition_probability(
-                model, state, neighbour)
+                improvement)
             if random.random() <= transition_probability:
-                next_state = neighbour
+                next_state = move.make()
 
         self._update_temperature()
         return next_state
 
-    def _calculate_transition_probability(self, model: Problem, old_state: State, new_state: State) -> float:
+    def _calculate_transition_probability(self, delta: float) -> float:
         # TODO:
         # - calculate probability of transition according to the metropolis function
         #   p = exp(delta / temperature)
-        #   where: delta is the improvement of the objective function (model has a corresponding method)
+        #   where: delta is the improvement of the objective function
         # - use mpmath to calculate the exponential
-        delta = model.improvement(new_state, old_state)
         return mpmath.exp(delta / self.temperature)
 
     def _update_temperature(self):
@@ -106,6 +110,8 @@ class SimulatedAnnealing(SubscribableAlgorithm):
             return self._perturb(model, self.config.escape_perturbation_size)
         if strategy == SAEscapeStrategy.Reheat:
             return self._reheat(state)
+        if strategy == SAEscapeStrategy.Intensification:
+            return self._intensify(model, state)
 
     def _reheat(self, from_state: State):
         # TODO:
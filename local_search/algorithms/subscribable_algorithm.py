@@ -7,6 +7,7 @@ from local_search.algorithm_subscribers.algorithm_subscriber import AlgorithmSub
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.algorithms.algorithm import Algorithm
 from local_search.algorithms.algorithm_config import DEFAULT_CONFIG, AlgorithmConfig
+from local_search.problems.base.moves import Move, ReversibleMove
 from local_search.problems.base.problem import Problem
 from local_search.problems.base.state import State
 from dataclasses import dataclass
@@ -65,14 +66,25 @@ class SubscribableAlgorithm(Algorithm):
 
     def _perturb(self, model: Problem, how_much: int):
         perturbed_state = self.best_state
+        is_copied = False
         for _ in range(how_much):
             try:
-                perturbed_state = next(
-                    model.move_generator.random_moves(perturbed_state)).make()
+                move = next(model.move_generator.random_moves(perturbed_state))
             except StopIteration:
-                pass
+                continue
+            # once the best state is copied, the copy can be safely modified in place
+            if is_copied and isinstance(move, ReversibleMove):
+                perturbed_state = move.apply()
+            else:
+                perturbed_state = move.make()
+                is_copied = True
         return perturbed_state
 
+    def _intensify(self, model: Problem, state: State):
+        intensified_state = model.intensify(state)
+        # problems that can't intensify the search leave the state as it is
+        return state if intensified_state is None else intensified_state
+
     def _get_neighbours(self, model: Problem, state: State) -> Generator[State, None, None]:
         for move in model.move_generator.available_moves(state):
             neighbour = move.make()
@@ -85,6 +97,21 @@ class SubscribableAlgorithm(Algorithm):
             self._on_next_neighbour(model, state, neighbour)
             yield neighbour
 
+    def _get_moves(self, model: Problem, state: State) -> Generator[Move[State], None, None]:
+        for move in model.move_generator.available_moves(state):
+            self._on_next_move(model, state, move)
+            yield move
+
+    def _get_moves_around(self, model: Problem, state: State, variable: int) -> Generator[Move[State], None, None]:
+        for move in model.move_generator.moves_around(state, variable):
+            self._on_next_move(model, state, move)
+            yield move
+
+    def _get_random_moves(self, model: Problem, state: State) -> Generator[Move[State], None, None]:
+        for move in model.move_generator.random_moves(state):
+            self._on_next_move(model, state, move)
+            yield move
+
     def _is_stuck_in_local_optimum(self):
         return self.steps_from_last_state_update >= self.config.local_optimum_moves_threshold
 
@@ -114,6 +141,11 @@ class SubscribableAlgorithm(Algorithm):
         if self.best_state is None:
             self.best_state = new_state
 
+        if new_state is state:
+            # the state was already compared with the best one when the algorithm reached it
+            self.steps_from_last_state_update += 1
+            return
+
         if model.improvement(new_state, state) > 0:
             self.steps_from_last_state_update = 0
         else:
@@ -134,6 +166,11 @@ class SubscribableAlgorithm(Algorithm):
             subscribtion.subscriber.on_next_neighbour(
                 model, from_state, next_neighbour)
 
+    def _on_next_move(self, model: Problem, from_state: State, move: Move[State]):
+        """Called when algorithm evaluates next move without making it"""
+        for subscribtion in self._subscribtions:
+            subscribtion.subscriber.on_next_move(model, from_state, move)
+
     def _on_solution(self, model: Problem, solution: State):
         for subscribtion in self._subscribtions:
             subscribtion.subscriber.on_solution(model=model, solution=solution)
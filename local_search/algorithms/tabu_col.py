@@ -0,0 +1,158 @@
+import random
+from dataclasses import dataclass
+from typing import Set, Union
+
+import numpy as np
+
+from local_search.algorithms.algorithm_config import AlgorithmConfig
+from local_search.algorithms.subscribable_algorithm import SubscribableAlgorithm
+from local_search.problems.base.problem import Problem
+from local_search.problems.graph_coloring_problem.problem import GraphColoringProblem
+from local_search.problems.graph_coloring_problem.state import GraphColoringState
+
+
+@dataclass
+class TabuColConfig(AlgorithmConfig):
+    tabu_tenure: int = 10
+    tabu_tenure_conflicts_ratio: float = 0.6
+    iterations_per_step: int = 1000
+    escape_perturbation_size: int = 50
+
+
+DEFAULT_CONFIG = TabuColConfig()
+
+
+class TabuCol(SubscribableAlgorithm):
+    """
+    Implementation of the TabuCol algorithm for graph coloring.
+
+    Looks for a coloring with k colors and no conflicts (edges whose ends have the same color) by moving
+    conflicting vertices to the color that removes the most conflicts. The vertex can't go back to its old color
+    for a number of iterations that grows with the number of conflicting vertices, unless it gives
+    fewer conflicts than ever before with k colors. Changes of conflicts are read from the conflict table.
+    Once a coloring is found, the smallest color class is spread over the other colors and the search
+    continues with k - 1 colors. Only colorings without conflicts are passed on as next states.
+    """
+
+    def __init__(self, config: TabuColConfig = None):
+        self.config: TabuColConfig = config or DEFAULT_CONFIG
+        self._local_optimum_escapes = 0
+        # colorings without conflicts are returned, the search goes on with a copy with one color less
+        self._returned_state: Union[GraphColoringState, None] = None
+        self._state: Union[GraphColoringState, None] = None
+        # the returned coloring uses the fewest colors the graph may have, so there is nothing left to remove
+        self._cannot_shrink = False
+        self._colors = np.empty(0, dtype=np.int32)
+        self._tabu = np.empty((0, 0), dtype=np.int64)
+        self._conflicting: Set[int] = set()
+        self._conflicts = 0
+        self._best_conflicts = 0
+        self._iteration = 0
+        super().__init__(config=self.config)
+
+    def _find_next_state(self, model: Problem, state: GraphColoringState) -> Union[GraphColoringState, None]:
+        if not isinstance(model, GraphColoringProblem):
+            raise ValueError(
+                f'{type(self).__name__} solves only {GraphColoringProblem.__name__}')
+        if state is not self._returned_state:
+            self._start(model, state)
+        elif self._cannot_shrink:
+            return None
+        # moves are not passed to subscribers one by one, as checking every move would take most of the time
+        for _ in range(self.config.iterations_per_step):
+            if self._conflicts == 0:
+                break
+            self._make_tabu_move(model)
+        if self._conflicts > 0:
+            return state
+        self._returned_state = self._state.copy()
+        # a graph with any edge needs two colors
+        self._cannot_shrink = len(self._colors) <= (2 if model.graph.n_edges > 0 else 1)
+        if not self._cannot_shrink:
+            self._remove_color(model)
+        return self._returned_state
+
+    def _start(self, model: GraphColoringProblem, state: GraphColoringState):
+        self._returned_state = state
+        self._cannot_shrink = False
+        self._state = state.copy()
+        table = self._state.conflict_table(model.graph)
+        self._colors = np.array(sorted(self._state.used_colors), dtype=np.int32)
+        self._conflicts = int(table.bad_edges.sum())
+        colors = self._state.colors
+        self._conflicting = set(np.flatnonzero(
+            table.counts[np.arange(len(colors)), colors] > 0).tolist())
+        self._reset_tabu(table.n_colors)
+
+    def _reset_tabu(self, n_colors: int):
+        self._tabu = np.zeros((len(self._state.colors), n_colors), dtype=np.int64)
+        self._best_conflicts = self._conflicts
+        self._iteration = 0
+
+    def _recolor(self, model: GraphColoringProblem, vertex: int, color: int):
+        table = self._state.conflict_table(model.graph)
+        old_color = int(self._state.colors[vertex])
+        self._conflicts += table.conflicts(vertex, color) - table.conflicts(vertex, old_color)
+        self._state.recolor(vertex, color)
+        # only the vertex and its neighbours of both colors may start or stop conflicting
+        neighbours = model.graph.neighbours(vertex)
+        neighbour_colors = self._state.colors[neighbours]
+        touched = neighbours[(neighbour_colors == old_color) | (neighbour_colors == color)].tolist()
+        for touched_vertex in [vertex, *touched]:
+            if table.conflicts(touched_vertex, int(self._state.colors[touched_vertex])) > 0:
+                self._conflicting.add(touched_vertex)
+            else:
+                self._conflicting.discard(touched_vertex)
+
+    def _make_tabu_move(self, model: GraphColoringProblem):
+        table = self._state.conflict_table(model.graph)
+        vertices = np.fromiter(self._conflicting, dtype=np.int64, count=len(self._conflicting))
+        vertex_colors = self._state.colors[vertices]
+        current_conflicts = table.counts[vertices, vertex_colors]
+        deltas = table.counts[np.ix_(vertices, self._colors)] - current_conflicts[:, None]
+        movable = self._colors[None, :] != vertex_colors[:, None]
+        if not movable.any():
+            return
+        not_tabu = self._tabu[np.ix_(vertices, self._colors)] <= self._iteration
+        aspiration = self._conflicts + deltas < self._best_conflicts
+        allowed = movable & (not_tabu | aspiration)
+        if not allowed.any():
+            allowed = movable
+        best_delta = deltas[allowed].min()
+        candidates = np.argwhere(allowed & (deltas == best_delta))
+        (vertex_position, color_position) = candidates[random.randrange(len(candidates))]
+        vertex, old_color = int(vertices[vertex_position]), int(vertex_colors[vertex_position])
+        self._recolor(model, vertex, int(self._colors[color_position]))
+
+        self._tabu[vertex, old_color] = self._iteration + random.randrange(self.config.tabu_tenure) + \
+            int(self.config.tabu_tenure_conflicts_ratio * len(self._conflicting))
+        self._iteration += 1
+        self._best_conflicts = min(self._best_conflicts, self._conflicts)
+
+    def _remove_color(self, model: GraphColoringProblem):
+        """
+        Moves vertices of the smallest color class to colors of the fewest conflicts
+        """
+        table = self._state.conflict_table(model.graph)
+        removed_color = min(self._colors.tolist(), key=self._state.class_size)
+        self._colors = self._colors[self._colors != removed_color]
+        for vertex in np.flatnonzero(self._state.colors == removed_color).tolist():
+            conflicts = table.counts[vertex, self._colors]
+            best_colors = self._colors[conflicts == conflicts.min()]
+            self._recolor(model, vertex, int(random.choice(best_colors)))
+        self._reset_tabu(table.n_colors)
+
+    def escape_local_optimum(self, model: Problem, state: GraphColoringState,
+                             best_state: GraphColoringState) -> Union[GraphColoringState, None]:
+        self._local_optimum_escapes += 1
+        if self._local_optimum_escapes > self.config.local_optimum_escapes_max >= 0:
+            return None
+        if state is not self._returned_state:
+            self._start(model, state)
+        # random vertices of the searched coloring get random colors, the returned coloring stays the same
+        for vertex in random.sample(range(len(self._state.colors)),
+                                    min(self.config.escape_perturbation_size, len(self._state.colors))):
+            self._recolor(model, vertex, int(random.choice(self._colors)))
+        self._reset_tabu(self._tabu.shape[1])
+        self.steps_from_last_state_update = 0
+        return state
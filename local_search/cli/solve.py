@@ -54,6 +54,10 @@ def solve(config_file, **cli_options):
 
         - time_limit: maximum amount of time solver can run.
         - show_statistics: if solver should show current statistics of algorithm.
+        - optimality_gap: solver stops when the best state is at most this many percent worse than the bound on the objective. 0 disables it.
+        - clusters: number of spatial clusters of the traveling salesman problem solved in parallel processes and joined afterwards. 0 solves the whole problem at once.
+        - clustering: how points are split into clusters, kmeans or grid.
+        - runs: number of independent runs of the algorithm on the traveling salesman problem, whose tours are recombined with partition crossover. 0 makes a single run, it can't be used together with clusters.
 
     ## visualization
     Describes how visualization should behave (if exists).
@@ -1,7 +1,10 @@
-
 from local_search.cli.utils.console import print_section_name
 from local_search.cli.utils.create_dataclass import create_dataclass
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem
+from local_search.solvers.cluster_decomposition_solver import ClusterDecompositionSolver
 from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.partition_crossover_solver import PartitionCrossoverSolver
 from local_search.solvers.solver_config import SolverConfig
 
 
@@ -9,4 +12,15 @@ def create_solver(options):
     config = options.setdefault('solver_config', {})
     print_section_name("Configuring solver")
     config = create_dataclass(config, SolverConfig)
-    return LocalSearchSolver(config)
+    if config.clusters > 0 and config.runs > 0:
+        raise ValueError(
+            'Only one of clusters and runs can be greater than 0, clusters are not recombined between runs')
+    if config.clusters == 0 and config.runs == 0:
+        return LocalSearchSolver(config)
+    solver_type = ClusterDecompositionSolver if config.clusters > 0 else PartitionCrossoverSolver
+    # the problem may be chosen later, then the solver checks it when it is solving
+    problem_name = options.get('problem', {}).get('name')
+    if problem_name is not None and problem_name != camel_to_snake(TravelingSalesmanProblem.__name__):
+        raise ValueError(
+            f'{solver_type.__name__} solves only {TravelingSalesmanProblem.__name__}, got {problem_name}')
+    return solver_type(config)
@@ -0,0 +1,11 @@
+from typing import List
+
+
+def find_root(parents: List[int], point: int) -> int:
+    """
+    Returns root of the set of the point in the union-find forest, halving the path on the way
+    """
+    while parents[point] != point:
+        parents[point] = parents[parents[point]]
+        point = parents[point]
+    return point
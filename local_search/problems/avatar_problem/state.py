@@ -32,7 +32,7 @@ class AvatarState(State):
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, problem=None):
         cls.validate_data(data)
         image = Image.open(BytesIO(base64.b64decode(data['image'])))
         return cls(image)
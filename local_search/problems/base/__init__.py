@@ -1,3 +1,3 @@
-from local_search.problems.base.moves import Move
+from local_search.problems.base.moves import Move, ReversibleMove
 from local_search.problems.base.state import State
 from local_search.problems.base.problem import Problem, TProblem
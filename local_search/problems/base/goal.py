@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import Union
+from local_search.problems.base.moves import Move
 from local_search.problems.base.state import State
 
 class GoalType(Enum):
@@ -13,6 +15,13 @@ class Goal(ABC):
         Calculates objective for passed state
         """
 
+    def objective_delta_for(self, move: Move) -> Union[float, None]:
+        """
+        Calculates how the objective changes when the move is made, without making it.
+        Returns None if the goal can't evaluate the move incrementally.
+        """
+        return None
+
     @abstractmethod
     def human_readable_objective_for(self, state: State) -> str:
         """
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from random import sample
-from typing import Generator, TypeVar
+from typing import Generator, Iterable, TypeVar
 
 from local_search.problems.base.moves import Move
 from local_search.problems.base.state import State
@@ -25,3 +25,33 @@ class MoveGenerator(ABC):
         """
         Generates available moves from state
         """
+
+
+class LocalMoveGenerator(MoveGenerator, ABC):
+    """
+    Move generator which neighbourhood is made of moves around single decision variables
+    (e.g. points of the route in the traveling salesman problem).
+    Allows algorithms to look only at the variables which surroundings changed.
+    """
+
+    def available_moves(self, state: State) -> Generator[Move[State], None, None]:
+        for variable in self.variables(state):
+            yield from self.moves_around(state, variable)
+
+    @abstractmethod
+    def variables(self, state: State) -> Iterable[int]:
+        """
+        Returns all decision variables of the state
+        """
+
+    @abstractmethod
+    def moves_around(self, state: State, variable: int) -> Generator[Move[State], None, None]:
+        """
+        Generates available moves that change the surroundings of the variable
+        """
+
+    @abstractmethod
+    def touched_variables(self, move: Move[State]) -> Iterable[int]:
+        """
+        Returns variables which surroundings are changed by the move
+        """
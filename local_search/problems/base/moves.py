@@ -18,3 +18,24 @@ class Move(ABC, Generic[TState]):
         :param variable: decision variable on which we do want to make a move
         :returns: new state where passed :param variable: has modified value
         """
+
+
+class ReversibleMove(Move[TState], ABC):
+    """
+    Move that can be made in place, i.e. by modifying the state it was created for,
+    and then reverted. Allows checking moves without creating new states.
+    """
+
+    @abstractmethod
+    def apply(self) -> TState:
+        """
+        Makes this move in place.
+        :returns: the modified state the move was created for
+        """
+
+    @abstractmethod
+    def undo(self) -> TState:
+        """
+        Reverts changes made by `apply`.
+        :returns: the restored state the move was created for
+        """
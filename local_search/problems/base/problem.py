@@ -3,9 +3,10 @@ import local_search
 from abc import ABC, abstractmethod
 from pathlib import Path
 from enum import Enum
-from typing import Dict, Iterable, Type, TypeVar
+from typing import Dict, Iterable, Tuple, Type, TypeVar, Union
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.goal import Goal
+from local_search.problems.base.moves import Move, ReversibleMove
 from local_search.problems.base.state import State
 from local_search.problems.base.move_generator import MoveGenerator
 from dataclasses import dataclass
@@ -52,6 +53,45 @@ class Problem(ABC):
             new_state) - self.objective_for(old_state)
         return improvement * self.goal.type().value
 
+    def move_improvement(self, move: Move) -> float:
+        """
+        A helper method. Calculates how much the state reached by the move is better than the state the move starts from.
+        Uses the goal's delta evaluation when it's available, otherwise makes the move and compares both states.
+        Reversible moves are made in place and reverted afterwards, so no new state is created.
+        """
+        delta = self.goal.objective_delta_for(move)
+        if delta is not None:
+            return delta * self.goal.type().value
+        if isinstance(move, ReversibleMove):
+            old_objective = self.objective_for(move.state)
+            new_objective = self.objective_for(move.apply())
+            move.undo()
+            return (new_objective - old_objective) * self.goal.type().value
+        return self.improvement(move.make(), move.state)
+
+    def best_move(self, state: State) -> Union[Tuple[Move, float], None]:
+        """
+        Finds the most improving move from the state by evaluating the whole neighbourhood at once.
+        :returns: the move together with its improvement, or None if the neighbourhood can't be evaluated this way
+        """
+        return None
+
+    def objective_bound(self, time_limit: Union[float, None] = None) -> Union[float, None]:
+        """
+        Calculates bound on the objective that no state can beat, lower one for minimized goals and upper one for maximized.
+        :param time_limit: seconds that may be spent on the bound, a weaker bound is returned when it runs out
+        :returns: the bound, or None if the problem can't calculate it
+        """
+        return None
+
+    def intensify(self, state: State) -> Union[State, None]:
+        """
+        Improves the state with a problem specific method that is too expensive to be used for every move,
+        e.g. by solving small parts of the problem exactly. The passed state isn't modified.
+        :returns: the improved state, or None if the problem has no such method
+        """
+        return None
+
     @staticmethod
     @abstractmethod
     def get_available_move_generation_strategies() -> Iterable[str]:
@@ -46,12 +46,13 @@ class State(ABC):
                 f'Cannot create {cls.__name__} from passed dict. Missing params are: {",".join(missing_params)}')
 
     @classmethod
-    def from_dict(cls, data) -> 'State':
+    def from_dict(cls, data, problem=None) -> 'State':
         """
-        Creates state from dictionary
+        Creates state from dictionary.
+        States may skip data that the problem they belong to already contains and take it from the passed problem.
         """
         name = data['name']
         state_type = cls.states[name]
         state_type.validate_data(data)
         del data['name']
-        return state_type.from_dict(data)
+        return state_type.from_dict(data, problem)
@@ -0,0 +1,61 @@
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.graph import Graph
+
+
+class ConflictTable:
+    """
+    Number of neighbours of every vertex that have every color, kept up to date when vertices are recolored.
+
+    Together with the number of bad edges (edges whose ends have the same color) of every color class,
+    it gives the change of objectives caused by recoloring a vertex in O(1).
+    Recoloring a vertex updates it in O(deg(v)).
+    """
+
+    def __init__(self, graph: Graph, colors: np.ndarray):
+        self.graph = graph
+        n_colors = int(colors.max()) + 1
+        vertices = np.repeat(np.arange(len(colors)), graph.degrees())
+        self.counts = np.bincount(vertices * n_colors + colors[graph.indices], minlength=len(colors) * n_colors) \
+            .astype(np.int32).reshape(len(colors), n_colors)
+        # every bad edge is counted at both of its ends
+        self.bad_edges = np.bincount(colors, weights=self.counts[np.arange(len(colors)), colors],
+                                     minlength=n_colors).astype(np.int64) // 2
+
+    @property
+    def n_colors(self) -> int:
+        return self.counts.shape[1]
+
+    def conflicts(self, vertex: int, color: int) -> int:
+        """
+        Returns number of neighbours of the vertex that have the color
+        """
+        return int(self.counts[vertex, color]) if color < self.n_colors else 0
+
+    def class_bad_edges(self, color: int) -> int:
+        return int(self.bad_edges[color]) if color < self.n_colors else 0
+
+    def _add_colors(self, n_colors: int):
+        missing = n_colors - self.n_colors
+        self.counts = np.pad(self.counts, ((0, 0), (0, missing)))
+        self.bad_edges = np.pad(self.bad_edges, (0, missing))
+
+    def recolor(self, vertex: int, old_color: int, new_color: int):
+        """
+        Updates the table after the vertex changed its color
+        """
+        if new_color >= self.n_colors:
+            self._add_colors(new_color + 1)
+        self.bad_edges[old_color] -= self.counts[vertex, old_color]
+        self.bad_edges[new_color] += self.counts[vertex, new_color]
+        # every neighbour is listed once, so all of them can be updated at once
+        neighbours = self.graph.neighbours(vertex)
+        self.counts[neighbours, old_color] -= 1
+        self.counts[neighbours, new_color] += 1
+
+    def copy(self) -> 'ConflictTable':
+        new_table = ConflictTable.__new__(ConflictTable)
+        new_table.graph = self.graph
+        new_table.counts = self.counts.copy()
+        new_table.bad_edges = self.bad_edges.copy()
+        return new_table
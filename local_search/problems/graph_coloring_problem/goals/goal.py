@@ -1,9 +1,14 @@
-from abc import ABC
-from typing import List
+from abc import ABC, abstractmethod
+from typing import Union
+
+import numpy as np
 
 from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.base.moves import Move
 from local_search.problems.base.problem import Goal
-from local_search.problems.graph_coloring_problem.models.edge import Edge
+from local_search.problems.graph_coloring_problem.graph import Graph
+from local_search.problems.graph_coloring_problem.moves.change_color import ChangeColorMove
+from local_search.problems.graph_coloring_problem.moves.kempe_chain import KempeChainMove
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 
@@ -13,9 +18,9 @@ class GraphColoringGoal(Goal, ABC):
     """
     goals = {}
 
-    def __init__(self, edges: List[Edge], n_vertices: int):
-        self.edges = edges
-        self.n_vertices = n_vertices
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self.n_vertices = graph.n_vertices
 
     def __init_subclass__(cls):
         GraphColoringGoal.goals[camel_to_snake(cls.__name__)] = cls
@@ -23,25 +28,40 @@ class GraphColoringGoal(Goal, ABC):
     def _num_colors(self, state: GraphColoringState) -> int:
         # TODO:
         # return number of colors in the coloring
-        return len(set([v.color for v in state.coloring]))
+        return state.n_colors
 
-    def _bad_edges(self, state: GraphColoringState) -> List[int]:
-        # TODO:
-        # return number of bad edges of every color class in the graph
-        # tip. self.edges is the list of 'Edge' in the graph
-        bad_edges = [0 for _ in range(self.n_vertices)]
-        for edge in self.edges:
-            if state.coloring[edge.start].color == state.coloring[edge.end].color:
-                bad_edges[state.coloring[edge.start].color] += 1
-        return bad_edges
-
-    def _color_classes(self, state: GraphColoringState) -> List[int]:
-        # TODO:
-        # return sizes of the color classes
-        color_classes = [0 for _ in range(self.n_vertices)]
-        for vertex in state.coloring:
-            color_classes[vertex.color] += 1
-        return color_classes
+    def objective_delta_for(self, move: Move) -> Union[float, None]:
+        if isinstance(move, KempeChainMove):
+            if move.old_color == move.color:
+                return 0
+            return self._swap_delta(move.state, move.chain, move.old_color, move.color)
+        if not isinstance(move, ChangeColorMove):
+            return None
+        old_color = move.old_color
+        if old_color == move.color:
+            return 0
+        return self._recolor_delta(move.state, move.idx, old_color, move.color)
+
+    @staticmethod
+    def _swapped_vertices(state: GraphColoringState, chain: np.ndarray, first_color: int) -> int:
+        """
+        Calculates how many more vertices the class of the first color has after colors of the chain are swapped
+        """
+        first_vertices = int(np.count_nonzero(state.colors[chain] == first_color))
+        return len(chain) - 2 * first_vertices
+
+    @abstractmethod
+    def _swap_delta(self, state: GraphColoringState, chain: np.ndarray, first_color: int, second_color: int) -> int:
+        """
+        Calculates how the objective changes when the chain of vertices of two different colors swaps them.
+        Only classes of these colors change, and neighbours of the chain with these colors belong to the chain.
+        """
+
+    @abstractmethod
+    def _recolor_delta(self, state: GraphColoringState, idx: int, old_color: int, new_color: int) -> int:
+        """
+        Calculates how the objective changes when the vertex changes its color to a different one
+        """
 
     def human_readable_objective_for(self, state: GraphColoringState) -> str:
         return f"{self._num_colors(state)} colors"
@@ -1,3 +1,5 @@
+import numpy as np
+
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
@@ -6,8 +8,16 @@ from local_search.problems.graph_coloring_problem.state import GraphColoringStat
 class MaxClasses(GraphColoringGoal):
 
     def objective_for(self, state: GraphColoringState) -> int:
-        color_classes = self._color_classes(state)
-        return sum([cc ** 2 for cc in color_classes])
+        return int((state.class_sizes ** 2).sum())
+
+    def _swap_delta(self, state: GraphColoringState, chain: np.ndarray, first_color: int, second_color: int) -> int:
+        change = self._swapped_vertices(state, chain, first_color)
+        first_size, second_size = state.class_size(first_color), state.class_size(second_color)
+        return (first_size + change) ** 2 - first_size ** 2 + (second_size - change) ** 2 - second_size ** 2
+
+    def _recolor_delta(self, state: GraphColoringState, idx: int, old_color: int, new_color: int) -> int:
+        # (old_size - 1)^2 - old_size^2 + (new_size + 1)^2 - new_size^2
+        return 2 * (state.class_size(new_color) - state.class_size(old_color) + 1)
 
     def type(self) -> GoalType:
         return GoalType.MAX
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy as np
+
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
@@ -8,5 +10,13 @@ class MinColors(GraphColoringGoal):
     def objective_for(self, state: GraphColoringState) -> int:
         return self._num_colors(state)
 
+    def _swap_delta(self, state: GraphColoringState, chain: np.ndarray, first_color: int, second_color: int) -> int:
+        change = self._swapped_vertices(state, chain, first_color)
+        first_size, second_size = state.class_size(first_color), state.class_size(second_color)
+        return int(first_size + change > 0) - int(first_size > 0) + int(second_size - change > 0) - int(second_size > 0)
+
+    def _recolor_delta(self, state: GraphColoringState, idx: int, old_color: int, new_color: int) -> int:
+        return int(state.class_size(new_color) == 0) - int(state.class_size(old_color) == 1)
+
     def type(self) -> GoalType:
         return GoalType.MIN
\ No newline at end of file
@@ -1,16 +1,51 @@
-from typing import List
+import numpy as np
 
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 
+def _class_objective(bad_edges, class_size):
+    return 2 * bad_edges * class_size - class_size ** 2
+
+
 class MinFeasible(GraphColoringGoal):
 
     def objective_for(self, state: GraphColoringState) -> int:
-        bad_edges = self._bad_edges(state)
-        color_classes = self._color_classes(state)
-        return sum([2*bad_edges[i]*color_classes[i]-color_classes[i]**2 for i in range(self.n_vertices)])
+        # bad edges of every class are kept up to date by the conflict table, so only classes are summed
+        bad_edges = state.conflict_table(self.graph).bad_edges
+        # classes above the shorter of the arrays are empty
+        n_colors = min(len(bad_edges), len(state.class_sizes))
+        return int(_class_objective(bad_edges[:n_colors], state.class_sizes[:n_colors]).sum())
+
+    def _chain_bad_edges(self, state: GraphColoringState, chain: np.ndarray, color: int) -> int:
+        # all neighbours of the chain vertices with the same color are in the chain
+        table = state.conflict_table(self.graph)
+        if color >= table.n_colors:
+            return 0
+        vertices = chain[state.colors[chain] == color]
+        return int(table.counts[vertices, color].sum()) // 2
+
+    def _swap_delta(self, state: GraphColoringState, chain: np.ndarray, first_color: int, second_color: int) -> int:
+        table = state.conflict_table(self.graph)
+        change = self._swapped_vertices(state, chain, first_color)
+        bad_edges_change = self._chain_bad_edges(state, chain, second_color) - \
+            self._chain_bad_edges(state, chain, first_color)
+        first_bad_edges, first_size = table.class_bad_edges(first_color), state.class_size(first_color)
+        second_bad_edges, second_size = table.class_bad_edges(second_color), state.class_size(second_color)
+        return _class_objective(first_bad_edges + bad_edges_change, first_size + change) \
+            - _class_objective(first_bad_edges, first_size) \
+            + _class_objective(second_bad_edges - bad_edges_change, second_size - change) \
+            - _class_objective(second_bad_edges, second_size)
+
+    def _recolor_delta(self, state: GraphColoringState, idx: int, old_color: int, new_color: int) -> int:
+        table = state.conflict_table(self.graph)
+        old_bad_edges, old_size = table.class_bad_edges(old_color), state.class_size(old_color)
+        new_bad_edges, new_size = table.class_bad_edges(new_color), state.class_size(new_color)
+        return _class_objective(old_bad_edges - table.conflicts(idx, old_color), old_size - 1) \
+            - _class_objective(old_bad_edges, old_size) \
+            + _class_objective(new_bad_edges + table.conflicts(idx, new_color), new_size + 1) \
+            - _class_objective(new_bad_edges, new_size)
 
     def type(self) -> GoalType:
         return GoalType.MIN
\ No newline at end of file
@@ -0,0 +1,146 @@
+import hashlib
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from io import TextIOWrapper
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import numpy as np
+
+DIMACS_EXTENSION = '.col'
+# parsed graphs are kept here, so every benchmark is read from text only once
+CACHE_DIRECTORY = Path.home() / '.cache' / 'local_search' / 'graphs'
+
+_NOT_EDGE_LINE = re.compile(r'^(?!e\s).*$', re.MULTILINE)
+_PROBLEM_LINE = re.compile(r'^p\s+\S+\s+(\d+)', re.MULTILINE)
+
+
+@dataclass
+class Graph:
+    """
+    Undirected graph in compressed sparse row format.
+    Neighbours of vertex v are indices[indptr[v]:indptr[v + 1]], sorted, every edge is stored at both of its ends.
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+
+    @property
+    def n_vertices(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def neighbours(self, vertex: int) -> np.ndarray:
+        return self.indices[self.indptr[vertex]:self.indptr[vertex + 1]]
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def edges(self) -> np.ndarray:
+        """
+        Returns every edge once, as rows of the smaller and the greater vertex
+        """
+        starts = np.repeat(np.arange(self.n_vertices, dtype=self.indices.dtype), self.degrees())
+        lower = starts < self.indices
+        return np.column_stack((starts[lower], self.indices[lower]))
+
+    @classmethod
+    def from_edges(cls, edges: np.ndarray, n_vertices: Union[int, None] = None) -> 'Graph':
+        """
+        Creates graph from rows of vertex pairs, repeated edges and loops are dropped
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if n_vertices is None:
+            n_vertices = int(edges.max()) + 1 if len(edges) else 0
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        starts = np.concatenate((edges[:, 0], edges[:, 1]))
+        ends = np.concatenate((edges[:, 1], edges[:, 0]))
+        keys = np.unique(starts * n_vertices + ends)
+        starts, ends = np.divmod(keys, n_vertices)
+        indptr = np.zeros(n_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(starts, minlength=n_vertices), out=indptr[1:])
+        return cls(indptr, ends.astype(np.int32))
+
+
+def read_edge_list(file_buffer: TextIOWrapper) -> np.ndarray:
+    """
+    Reads pairs of vertices numbered from 0, one edge per line
+    """
+    return np.array(file_buffer.read().split(), dtype=np.int64).reshape(-1, 2)
+
+
+def read_dimacs(file_buffer: TextIOWrapper) -> Tuple[np.ndarray, int]:
+    """
+    Reads graph written in DIMACS format, with edges in 'e u v' lines and vertices numbered from 1
+    :returns: edges with vertices numbered from 0 and number of vertices
+    """
+    text = file_buffer.read()
+    problem_line = _PROBLEM_LINE.search(text)
+    if problem_line is None:
+        raise ValueError('DIMACS graph has no problem line')
+    numbers = np.array(_NOT_EDGE_LINE.sub('', text).replace('e', ' ').split(), dtype=np.int64)
+    return numbers.reshape(-1, 2) - 1, int(problem_line.group(1))
+
+
+def _cache_path(path: Path) -> Path:
+    return CACHE_DIRECTORY / f'{hashlib.sha1(str(path.resolve()).encode()).hexdigest()}.npz'
+
+
+def _read_cache(cache_path: Path, source: List[int]) -> Union[Graph, None]:
+    """
+    :returns: graph saved in the cache, or None if it is missing, made from another version of the file or damaged
+    """
+    try:
+        with np.load(cache_path) as cached:
+            if cached['source'].tolist() == source:
+                return Graph(cached['indptr'], cached['indices'])
+    except Exception:
+        # e.g. the file was cut short, it is then written again
+        pass
+    return None
+
+
+def _write_cache(cache_path: Path, graph: Graph, source: List[int]):
+    """
+    Saves the graph to a temporary file first and then moves it to the cache,
+    so other processes never read a partially written file
+    """
+    CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=CACHE_DIRECTORY, suffix='.tmp')
+    try:
+        with os.fdopen(file_descriptor, 'wb') as cache_file:
+            np.savez(cache_file, indptr=graph.indptr, indices=graph.indices,
+                     source=np.array(source, dtype=np.int64))
+        os.replace(temporary_path, cache_path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def load_graph(path: Path) -> Graph:
+    """
+    Reads graph from an edge list or a DIMACS file.
+    Parsed graph is saved in the cache and read from there until the file changes.
+    """
+    stat = path.stat()
+    source = [stat.st_size, stat.st_mtime_ns]
+    cache_path = _cache_path(path)
+    if cache_path.exists():
+        graph = _read_cache(cache_path, source)
+        if graph is not None:
+            return graph
+    with open(path) as file_buffer:
+        if path.suffix == DIMACS_EXTENSION:
+            graph = Graph.from_edges(*read_dimacs(file_buffer))
+        else:
+            graph = Graph.from_edges(read_edge_list(file_buffer))
+    try:
+        _write_cache(cache_path, graph, source)
+    except OSError:
+        # the graph can still be used when the cache can't be written
+        pass
+    return graph
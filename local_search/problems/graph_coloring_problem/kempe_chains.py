@@ -0,0 +1,73 @@
+from typing import Dict, Union
+
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.graph import Graph
+
+
+class KempeChains:
+    """
+    Kempe chains of a coloring, i.e. connected components of the subgraph induced by vertices of two colors.
+
+    Chains are found on demand with breadth first search and kept for every pair of colors,
+    so they are shared by all moves that swap the same chain. When a vertex changes its color,
+    only chains of pairs with its old or new color are forgotten.
+    """
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        # chains of every vertex for every pair of colors, both orders of a pair refer to the same dict
+        self._chains: Dict[int, Dict[int, Dict[int, np.ndarray]]] = {}
+
+    def chain(self, colors: np.ndarray, vertex: int, color: int,
+              max_size: Union[int, None] = None) -> Union[np.ndarray, None]:
+        """
+        Finds the chain of vertices of the vertex color and the passed color that contains the vertex
+        :returns: sorted vertices of the chain, or None if it has more than `max_size` vertices
+        """
+        vertex_color = int(colors[vertex])
+        chains = self._chains.get(vertex_color, {}).get(color)
+        if chains is not None and vertex in chains:
+            chain = chains[vertex]
+            return chain if max_size is None or len(chain) <= max_size else None
+        chain = self._search(colors, vertex, vertex_color, color, max_size)
+        if chain is None:
+            return None
+        if chains is None:
+            chains = {}
+            self._chains.setdefault(vertex_color, {})[color] = chains
+            self._chains.setdefault(color, {})[vertex_color] = chains
+        for member in chain.tolist():
+            chains[member] = chain
+        return chain
+
+    def _search(self, colors: np.ndarray, vertex: int, first_color: int, second_color: int,
+                max_size: Union[int, None]) -> Union[np.ndarray, None]:
+        visited = {vertex}
+        queue = [vertex]
+        for current in queue:
+            neighbours = self.graph.neighbours(current)
+            neighbour_colors = colors[neighbours]
+            for neighbour in neighbours[(neighbour_colors == first_color) | (neighbour_colors == second_color)].tolist():
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    queue.append(neighbour)
+            if max_size is not None and len(visited) > max_size:
+                return None
+        return np.sort(np.array(queue, dtype=np.int64))
+
+    def invalidate(self, old_color: int, new_color: int):
+        """
+        Forgets chains that may have changed after a vertex changed its color
+        """
+        for color in (old_color, new_color):
+            for other_color in self._chains.pop(color, {}):
+                self._chains.get(other_color, {}).pop(color, None)
+
+    def copy(self) -> 'KempeChains':
+        # chains of a pair are only added while no vertex of the pair changes its color,
+        # and then they are forgotten, so states with the same vertices of the pair can share them
+        new_chains = KempeChains(self.graph)
+        new_chains._chains = {color: dict(chains)
+                              for color, chains in self._chains.items()}
+        return new_chains
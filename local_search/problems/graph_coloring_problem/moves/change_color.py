@@ -1,21 +1,22 @@
 import random
 from typing import Generator
 
-from local_search.problems.base.moves import Move
+from local_search.problems.graph_coloring_problem.moves.move import GraphColoringMove
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
-import copy
 
 
-class ChangeColorMove(Move[GraphColoringState]):
+class ChangeColorMove(GraphColoringMove):
     def __init__(self, from_state: GraphColoringState, idx: int, color: int):
         super().__init__(from_state)
         (self.idx, self.color) = idx, color
+        self.old_color = int(from_state.colors[idx])
 
-    def make(self) -> GraphColoringState:
-        new_coloring = copy.deepcopy(self.state.coloring)
-        new_coloring[self.idx].color = self.color
-        return GraphColoringState(coloring=new_coloring)
+    def _apply_to(self, state: GraphColoringState):
+        state.recolor(self.idx, self.color)
+
+    def _undo_on(self, state: GraphColoringState):
+        state.recolor(self.idx, self.old_color)
 
 
 class ChangeColor(GraphColoringMoveGenerator):
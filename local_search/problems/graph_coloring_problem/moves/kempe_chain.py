@@ -1,59 +1,67 @@
 import random
-from typing import Generator, Set, Dict, List
+from typing import Generator, Union
 
-from local_search.problems.base.moves import Move
-from local_search.problems.graph_coloring_problem.models.vertex import Vertex
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.graph import Graph
+from local_search.problems.graph_coloring_problem.moves.move import GraphColoringMove
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
-import copy
 
 
-class KempeChainMove(Move[GraphColoringState]):
-    def __init__(self, graph: Dict[int, Set[int]], from_state: GraphColoringState, idx: int, color: int):
+class KempeChainMove(GraphColoringMove):
+    """
+    Swaps colors of the Kempe chain, i.e. of vertices of the vertex color and the passed color
+    connected with the vertex through vertices of these colors.
+    """
+
+    def __init__(self, graph: Graph, from_state: GraphColoringState, idx: int, color: int,
+                 chain: Union[np.ndarray, None] = None):
         super().__init__(from_state)
         self.idx = idx
         self.color = color
         self.graph = graph
-        self.old_color = self.state.coloring[idx].color
-
-    def _kempe_chain(self, coloring: List[Vertex]):
-        # TODO: to the kempe chain thing
-        # tip 1. it's just a BFS walk over the graph
-        # tip 2. self.graph[c] are the neighbors of node c
-        old_color = self.old_color
-        new_color = self.color
-        chain = [self.idx]
-        while len(chain) > 0:
-            new_chain_links = []
-            for c in chain:
-                for n in self.graph[c]:
-                    if coloring[n].color == new_color:
-                        coloring[n].color = old_color
-                        new_chain_links.append(n)
-            chain = list(set(new_chain_links))
-            new_color, old_color = old_color, new_color
-
-    def make(self) -> GraphColoringState:
-        new_coloring = copy.deepcopy(self.state.coloring)
-        new_coloring[self.idx].color = self.color
-        self._kempe_chain(new_coloring)
-        return GraphColoringState(coloring=new_coloring)
+        self.old_color = int(self.state.colors[idx])
+        self.chain = chain if chain is not None else \
+            from_state.kempe_chains(graph).chain(from_state.colors, idx, color)
+
+    def _swap(self, state: GraphColoringState):
+        for vertex in self.chain.tolist():
+            state.recolor(vertex, self.color if state.colors[vertex] == self.old_color else self.old_color)
+
+    def _apply_to(self, state: GraphColoringState):
+        self._swap(state)
+
+    def _undo_on(self, state: GraphColoringState):
+        # swapping colors of the chain again gives them back
+        self._swap(state)
 
 
 class KempeChain(GraphColoringMoveGenerator):
+    """
+    Swaps colors of Kempe chains.
+    Chains larger than `MAX_CHAIN_SIZE` vertices are skipped, so that every move changes only a part of the graph.
+    """
+    MAX_CHAIN_SIZE: Union[int, None] = None
+
+    def chain(self, state: GraphColoringState, idx: int, color: int) -> Union[np.ndarray, None]:
+        return state.kempe_chains(self.graph).chain(state.colors, idx, color, self.MAX_CHAIN_SIZE)
 
     def random_moves(self, state: GraphColoringState) -> Generator[KempeChainMove, None, None]:
         while True:
             idx = random.randrange(self.n_vertices)
             available_colors = self.get_available_colors(idx, state)
-            yield KempeChainMove(self.graph,
-                                 state,
-                                 idx=random.randrange(self.n_vertices),
-                                 color=random.choice(available_colors))
+            if not available_colors:
+                break
+            color = random.choice(available_colors)
+            chain = self.chain(state, idx, color)
+            if chain is not None:
+                yield KempeChainMove(self.graph, state, idx, color, chain)
 
     def available_moves(self, state: GraphColoringState) -> Generator[KempeChainMove, None, None]:
         for idx in range(self.n_vertices):
             for color in self.get_available_colors(idx, state):
-                if state.coloring[idx].color == color:
-                    continue
-                yield KempeChainMove(self.graph, state, idx, color)
+                chain = self.chain(state, idx, color)
+                # every chain is swapped by moves from all of its vertices, only the one from its first vertex is kept
+                if chain is not None and chain[0] == idx:
+                    yield KempeChainMove(self.graph, state, idx, color, chain)
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+from local_search.problems.base import ReversibleMove
+from local_search.problems.graph_coloring_problem.state import GraphColoringState
+
+
+class GraphColoringMove(ReversibleMove[GraphColoringState], ABC):
+    """
+    Base class for moves of the graph coloring problem.
+
+    Every move recolors a few vertices, so it is made in place by changing their colors
+    and reverted by giving them back their old colors.
+    """
+
+    def make(self) -> GraphColoringState:
+        new_state = self.state.copy()
+        self._apply_to(new_state)
+        return new_state
+
+    def apply(self) -> GraphColoringState:
+        self._apply_to(self.state)
+        return self.state
+
+    def undo(self) -> GraphColoringState:
+        self._undo_on(self.state)
+        return self.state
+
+    @abstractmethod
+    def _apply_to(self, state: GraphColoringState):
+        """
+        Recolors vertices of passed state in place
+        """
+
+    @abstractmethod
+    def _undo_on(self, state: GraphColoringState):
+        """
+        Reverts modifications made by `_apply_to` on passed state
+        """
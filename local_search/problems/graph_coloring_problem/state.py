@@ -1,34 +1,106 @@
-
-from dataclasses import dataclass
-from typing import List
-import random
+from dataclasses import dataclass, field
+from typing import Set, Union
+import numpy as np
 from local_search.problems.base.state import State
-from local_search.problems.graph_coloring_problem.models.vertex import Vertex
-from copy import deepcopy
+from local_search.problems.graph_coloring_problem.conflict_table import ConflictTable
+from local_search.problems.graph_coloring_problem.graph import Graph
+from local_search.problems.graph_coloring_problem.kempe_chains import KempeChains
 
 
 @dataclass
 class GraphColoringState(State):
-    coloring: List[Vertex]
+    colors: np.ndarray
+    _conflicts: Union[ConflictTable, None] = field(
+        default=None, init=False, repr=False, compare=False)
+    _kempe_chains: Union[KempeChains, None] = field(
+        default=None, init=False, repr=False, compare=False)
+    # number of vertices of every color and colors that have any vertex, kept up to date by `recolor`
+    class_sizes: np.ndarray = field(init=False, repr=False, compare=False)
+    used_colors: Set[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.colors = np.asarray(self.colors, dtype=np.int32)
+        self.class_sizes = np.bincount(self.colors)
+        self.used_colors = set(np.flatnonzero(self.class_sizes).tolist())
+
+    @property
+    def n_colors(self) -> int:
+        return len(self.used_colors)
+
+    def class_size(self, color: int) -> int:
+        return int(self.class_sizes[color]) if color < len(self.class_sizes) else 0
+
+    def conflict_table(self, graph: Graph) -> ConflictTable:
+        """
+        Table of colors of neighbours of every vertex.
+        Computed on first use and then kept up to date by `recolor`.
+        """
+        if self._conflicts is None:
+            self._conflicts = ConflictTable(graph, self.colors)
+        return self._conflicts
+
+    def kempe_chains(self, graph: Graph) -> KempeChains:
+        """
+        Kempe chains of the coloring.
+        Found on first use and then forgotten by `recolor` when they may have changed.
+        """
+        if self._kempe_chains is None:
+            self._kempe_chains = KempeChains(graph)
+        return self._kempe_chains
+
+    def recolor(self, idx: int, color: int):
+        """
+        Changes color of the vertex in place
+        """
+        old_color = int(self.colors[idx])
+        self.colors[idx] = color
+        if color >= len(self.class_sizes):
+            self.class_sizes = np.pad(
+                self.class_sizes, (0, color + 1 - len(self.class_sizes)))
+        self.class_sizes[old_color] -= 1
+        if self.class_sizes[old_color] == 0:
+            self.used_colors.discard(old_color)
+        self.class_sizes[color] += 1
+        self.used_colors.add(color)
+        if self._conflicts is not None:
+            self._conflicts.recolor(idx, old_color, color)
+        if self._kempe_chains is not None:
+            self._kempe_chains.invalidate(old_color, color)
+
+    def copy(self) -> 'GraphColoringState':
+        new_state = GraphColoringState(colors=self.colors.copy())
+        if self._conflicts is not None:
+            new_state._conflicts = self._conflicts.copy()
+        if self._kempe_chains is not None:
+            new_state._kempe_chains = self._kempe_chains.copy()
+        return new_state
 
     def __str__(self):
-        return " ".join([f"({v.idx}: {v.color})" for v in self.coloring])
+        return " ".join([f"({idx}: {color})" for idx, color in enumerate(self.colors.tolist())])
 
     def __eq__(self, other: 'GraphColoringState'):
         if other is None:
             return False
-        return all(ov.color == sv.color for sv, ov in zip(self.coloring, other.coloring))
+        return np.array_equal(self.colors, other.colors)
 
     def asdict(self):
         base = super().asdict()
         return {
-            'coloring': [(vertex.idx, vertex.color) for vertex in self.coloring],
+            'coloring': list(enumerate(self.colors.tolist())),
             **base
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def validate_data(cls, data):
+        # colors are saved as pairs of vertex index and its color
+        if 'coloring' not in data:
+            raise ValueError(
+                f'Cannot create {cls.__name__} from passed dict. Missing params are: coloring')
+
+    @classmethod
+    def from_dict(cls, data, problem=None):
         cls.validate_data(data)
-        coloring = [Vertex(idx=vertex_tuple[0], color=vertex_tuple[1])
-                    for vertex_tuple in data['coloring']]
-        return cls(coloring)
+        colors = np.empty(len(data['coloring']), dtype=np.int32)
+        for idx, color in data['coloring']:
+            colors[idx] = color
+        return cls(colors)
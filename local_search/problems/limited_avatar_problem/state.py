@@ -50,7 +50,7 @@ class LimitedAvatarState(State):
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def from_dict(cls, data, problem=None):
         cls.validate_data(data)
         data['polygons'] = [Polygon(vertices=[Vertex(x=vertex[0], y=vertex[1]) for vertex in polygon[0]],
                                     color=Color(polygon[1][0], polygon[1][1], polygon[1][2], polygon[1][3]))
@@ -0,0 +1,257 @@
+import random
+from abc import ABC, abstractmethod
+from math import cos, pi, sin
+from typing import List, Tuple, Union
+
+import numpy as np
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.helpers.union_find import find_root
+from local_search.problems.traveling_salesman_problem.spatial_index import GridIndex
+
+
+class TourConstruction(ABC):
+    """
+    Base class for heuristics that build a tour visiting every point.
+    """
+    constructions = {}
+    # constructions that place points by their coordinates, not by distances between them
+    USES_COORDINATES = False
+
+    def __init_subclass__(cls):
+        TourConstruction.constructions[camel_to_snake(cls.__name__)] = cls
+
+    def __init__(self, coordinates: np.ndarray, distances: np.ndarray, neighbours: np.ndarray,
+                 spatial_index: Union[GridIndex, None] = None):
+        self.coordinates = coordinates
+        self.distances = distances
+        self.neighbours = neighbours
+        # grid over the points, passed only when distances grow with the distance on the plane
+        self.spatial_index = spatial_index
+
+    @abstractmethod
+    def tour(self) -> np.ndarray:
+        """
+        Returns points in the order they should be visited
+        """
+
+    def _candidate_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns edges between every point and its nearest neighbours, sorted from the shortest one
+        """
+        n_points, n_neighbours = self.neighbours.shape
+        starts = np.repeat(np.arange(n_points, dtype=np.int64), n_neighbours)
+        ends = self.neighbours.ravel().astype(np.int64)
+        edges = np.unique(np.minimum(starts, ends) * n_points +
+                          np.maximum(starts, ends))
+        starts, ends = edges // n_points, edges % n_points
+        by_length = np.argsort(self.distances[starts, ends], kind='stable')
+        return starts[by_length], ends[by_length]
+
+    def _nearest(self, point: int, candidates: np.ndarray) -> int:
+        return int(candidates[np.argmin(self.distances[point, candidates])])
+
+
+class Random(TourConstruction):
+    """
+    Visits points in random order.
+    """
+
+    def tour(self) -> np.ndarray:
+        tour = np.arange(len(self.coordinates), dtype=np.int32)
+        np.random.default_rng(random.getrandbits(32)).shuffle(tour)
+        return tour
+
+
+class NearestNeighbour(TourConstruction):
+    """
+    Starts in a random point and always goes to the nearest point that wasn't visited yet.
+    """
+
+    def tour(self) -> np.ndarray:
+        n_points = len(self.coordinates)
+        remaining = np.ones(n_points, dtype=bool)
+        remaining_in_cells = None if self.spatial_index is None else self.spatial_index.points_per_cell()
+        tour = np.empty(n_points, dtype=np.int32)
+        current = random.randrange(n_points)
+        for step in range(n_points):
+            tour[step] = current
+            remaining[current] = False
+            if remaining_in_cells is not None:
+                remaining_in_cells[self.spatial_index.flat_cells[current]] -= 1
+            if step == n_points - 1:
+                break
+            following = next((int(neighbour) for neighbour in self.neighbours[current]
+                              if remaining[neighbour]), None)
+            if following is None:
+                # all of the nearest neighbours were visited, so the search goes further
+                following = self._nearest(current, np.flatnonzero(remaining)) if remaining_in_cells is None \
+                    else self.spatial_index.nearest_remaining(current, remaining, remaining_in_cells)
+            current = following
+        return tour
+
+
+class GreedyEdge(TourConstruction):
+    """
+    Adds edges from the shortest one, skipping those that would make a point visited three times or close a cycle.
+    Candidate edges connect points with their nearest neighbours, the paths left at the end are joined
+    going from the end of one of them to the nearest end of another.
+    """
+
+    def tour(self) -> np.ndarray:
+        n_points = len(self.coordinates)
+        parents = list(range(n_points))
+        adjacent: List[List[int]] = [[] for _ in range(n_points)]
+        for start, end in zip(*map(np.ndarray.tolist, self._candidate_edges())):
+            if len(adjacent[start]) == 2 or len(adjacent[end]) == 2:
+                continue
+            start_root, end_root = find_root(parents, start), find_root(parents, end)
+            if start_root == end_root:
+                continue
+            parents[start_root] = end_root
+            adjacent[start].append(end)
+            adjacent[end].append(start)
+        return self._join_paths(adjacent)
+
+    def _join_paths(self, adjacent: List[List[int]]) -> np.ndarray:
+        path_ends = np.array([point for point, neighbours in enumerate(adjacent) if len(neighbours) < 2],
+                             dtype=np.int64)
+        available = np.ones(len(adjacent), dtype=bool)
+        tour = []
+        current = int(random.choice(path_ends))
+        while True:
+            previous = None
+            while True:
+                tour.append(current)
+                available[current] = False
+                following = [point for point in adjacent[current]
+                             if point != previous]
+                if not following:
+                    break
+                previous, current = current, following[0]
+            path_ends = path_ends[available[path_ends]]
+            if len(path_ends) == 0:
+                return np.array(tour, dtype=np.int32)
+            current = next((int(neighbour) for neighbour in self.neighbours[current]
+                            if available[neighbour] and len(adjacent[neighbour]) < 2), None)
+            if current is None:
+                current = self._nearest(tour[-1], path_ends)
+
+
+class SpaceFillingCurve(TourConstruction):
+    """
+    Visits points in the order of a Hilbert curve laid over randomly rotated plane.
+    """
+    # the curve goes through a grid of 2^ORDER x 2^ORDER cells
+    ORDER = 16
+    USES_COORDINATES = True
+
+    def _hilbert_indices(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        side = 1 << self.ORDER
+        indices = np.zeros(len(xs), dtype=np.int64)
+        step = side // 2
+        while step > 0:
+            rx = (xs & step) > 0
+            ry = (ys & step) > 0
+            indices += step * step * ((3 * rx) ^ ry)
+            # rotate the quadrant, so that the curve inside it starts and ends next to the neighbouring ones
+            flip = ~ry & rx
+            xs = np.where(flip, side - 1 - xs, xs)
+            ys = np.where(flip, side - 1 - ys, ys)
+            xs, ys = np.where(ry, xs, ys), np.where(ry, ys, xs)
+            step //= 2
+        return indices
+
+    def tour(self) -> np.ndarray:
+        angle = random.uniform(0, 2 * pi)
+        rotation = np.array([[cos(angle), -sin(angle)],
+                            [sin(angle), cos(angle)]])
+        coordinates = self.coordinates @ rotation
+        coordinates -= coordinates.min(axis=0)
+        scale = ((1 << self.ORDER) - 1) / max(coordinates.max(), 1e-9)
+        cells = (coordinates * scale).astype(np.int64)
+        return np.argsort(self._hilbert_indices(cells[:, 0], cells[:, 1]), kind='stable').astype(np.int32)
+
+
+class ChristofidesLite(TourConstruction):
+    """
+    Christofides algorithm with the minimum weight matching replaced by a greedy one.
+
+    Minimum spanning tree is built from the edges between nearest neighbours, points with odd degree are
+    matched greedily and the eulerian circuit of both is shortcut to a tour.
+    """
+    # number of points of a component checked when looking for the edge that connects it with the rest of the tree
+    SAMPLE_SIZE = 256
+
+    def _spanning_tree(self) -> List[Tuple[int, int]]:
+        n_points = len(self.coordinates)
+        parents = list(range(n_points))
+        tree = []
+        for start, end in zip(*map(np.ndarray.tolist, self._candidate_edges())):
+            start_root, end_root = find_root(parents, start), find_root(parents, end)
+            if start_root != end_root:
+                parents[start_root] = end_root
+                tree.append((start, end))
+        # nearest neighbours of clustered points may not connect all of them
+        while len(tree) < n_points - 1:
+            roots = np.array([find_root(parents, point)
+                             for point in range(n_points)])
+            labels, sizes = np.unique(roots, return_counts=True)
+            component = labels[np.argmin(sizes)]
+            members, others = np.flatnonzero(
+                roots == component), np.flatnonzero(roots != component)
+            if len(members) > self.SAMPLE_SIZE:
+                members = np.random.default_rng(random.getrandbits(32)).choice(
+                    members, self.SAMPLE_SIZE, replace=False)
+            lengths = self.distances[np.ix_(members, others)]
+            member, other = np.unravel_index(np.argmin(lengths), lengths.shape)
+            start, end = int(members[member]), int(others[other])
+            parents[find_root(parents, start)] = find_root(parents, end)
+            tree.append((start, end))
+        return tree
+
+    def _matching(self, odd: np.ndarray) -> List[Tuple[int, int]]:
+        unmatched = np.zeros(len(self.coordinates), dtype=bool)
+        unmatched[odd] = True
+        matching = []
+        for start, end in zip(*map(np.ndarray.tolist, self._candidate_edges())):
+            if unmatched[start] and unmatched[end]:
+                unmatched[start] = unmatched[end] = False
+                matching.append((start, end))
+        left = np.flatnonzero(unmatched)
+        while len(left):
+            start, left = int(left[0]), left[1:]
+            closest = int(np.argmin(self.distances[start, left]))
+            matching.append((start, int(left[closest])))
+            left = np.delete(left, closest)
+        return matching
+
+    def tour(self) -> np.ndarray:
+        n_points = len(self.coordinates)
+        tree = self._spanning_tree()
+        degrees = np.bincount(np.array(tree, dtype=np.int64).ravel(),
+                              minlength=n_points) if tree else np.zeros(n_points, dtype=np.int64)
+        edges = tree + self._matching(np.flatnonzero(degrees % 2))
+        adjacent: List[List[int]] = [[] for _ in range(n_points)]
+        for edge, (start, end) in enumerate(edges):
+            adjacent[start].append(edge)
+            adjacent[end].append(edge)
+        used = [False] * len(edges)
+        visited = np.zeros(n_points, dtype=bool)
+        tour = []
+        stack = [random.randrange(n_points)]
+        while stack:
+            point = stack[-1]
+            while adjacent[point] and used[adjacent[point][-1]]:
+                adjacent[point].pop()
+            if adjacent[point]:
+                edge = adjacent[point].pop()
+                used[edge] = True
+                start, end = edges[edge]
+                stack.append(end if start == point else start)
+            else:
+                stack.pop()
+                # points visited for the second time are skipped
+                if not visited[point]:
+                    visited[point] = True
+                    tour.append(point)
+        return np.array(tour, dtype=np.int32)
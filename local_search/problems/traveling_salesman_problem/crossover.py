@@ -0,0 +1,148 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from local_search.helpers.union_find import find_root
+
+# smallest shortening of the tour that counts as an improvement, smaller ones come from rounding
+MIN_IMPROVEMENT = 1e-9
+
+# path of a tour through a component: the component, start and end index of the path in the tour
+Run = Tuple[int, int, int]
+
+
+def tour_length(distances, tour: np.ndarray) -> float:
+    return float(distances[tour, np.roll(tour, -1)].sum())
+
+
+def _shared_edges(tour: np.ndarray, other: np.ndarray, n_points: int) -> np.ndarray:
+    """
+    Checks for every edge of the tour, from point at an index to the next one, whether the other tour has it too
+    """
+    successors = np.full(n_points, -1, dtype=np.int64)
+    predecessors = np.full(n_points, -1, dtype=np.int64)
+    successors[other], predecessors[other] = np.roll(other, -1), np.roll(other, 1)
+    following = np.roll(tour, -1)
+    return (successors[tour] == following) | (predecessors[tour] == following)
+
+
+def _with_ghosts(tour: np.ndarray, split: np.ndarray) -> np.ndarray:
+    """
+    Visits ghost of every split point, numbered as the point plus number of points, right after the point
+    """
+    copies = 1 + split[tour]
+    extended = np.repeat(tour, copies)
+    ghosts = (np.cumsum(copies) - 1)[split[tour]]
+    extended[ghosts] += len(split)
+    return extended
+
+
+def _components(first: np.ndarray, second: np.ndarray, n_points: int) -> np.ndarray:
+    """
+    Splits union of both tours without their shared edges into connected components
+    :returns: component of every point, -1 for points whose edges are all shared
+    """
+    parents = list(range(n_points))
+    in_component = np.zeros(n_points, dtype=bool)
+    for tour, other in ((first, second), (second, first)):
+        different = ~_shared_edges(tour, other, n_points)
+        starts, ends = tour[different], np.roll(tour, -1)[different]
+        in_component[starts] = in_component[ends] = True
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            parents[find_root(parents, start)] = find_root(parents, end)
+    roots = np.array([find_root(parents, point) for point in range(n_points)])
+    return np.where(in_component, roots, -1)
+
+
+def _runs(tour: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, List[Run]]:
+    """
+    Splits the tour into paths of points from the same component.
+    :returns: the tour rotated so that it starts with a path, and the paths
+    """
+    components = labels[tour]
+    boundaries = np.flatnonzero(components != np.roll(components, 1))
+    if len(boundaries) == 0:
+        return tour, [(int(components[0]), 0, len(tour))]
+    tour = np.roll(tour, -boundaries[0])
+    starts = boundaries - boundaries[0]
+    ends = np.append(starts[1:], len(tour))
+    return tour, [(int(labels[tour[start]]), int(start), int(end)) for start, end in zip(starts, ends)]
+
+
+def _paths_by_ends(tour: np.ndarray, runs: List[Run]) -> Dict[int, Dict[Tuple[int, int], Tuple[int, int]]]:
+    """
+    Groups paths through components by the component and the pair of points at their ends
+    """
+    paths = {}
+    for component, start, end in runs:
+        if component >= 0:
+            ends = tuple(sorted((int(tour[start]), int(tour[end - 1]))))
+            paths.setdefault(component, {})[ends] = (start, end)
+    return paths
+
+
+def _lengths(distances, tour: np.ndarray, runs: List[Run], n_points: int) -> Dict[int, float]:
+    """
+    Sums lengths of paths of the tour through every component, ghosts are at no distance from their points
+    """
+    points = tour % n_points
+    edges = np.concatenate(([0.0], np.cumsum(
+        distances[points[:-1], points[1:]])))
+    lengths = {}
+    for component, start, end in runs:
+        lengths[component] = lengths.get(
+            component, 0.0) + edges[end - 1] - edges[start]
+    return lengths
+
+
+def _offspring(distances, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Recombines tours with ghosts that follow their points in the direction in which the tours are passed
+    """
+    n_points = len(first)
+    shared = _shared_edges(first, second, n_points)
+    split = np.zeros(n_points, dtype=bool)
+    split[first] = ~shared & ~np.roll(shared, 1)
+    first, second = _with_ghosts(first, split), _with_ghosts(second, split)
+
+    labels = _components(first, second, 2 * n_points)
+    first, first_runs = _runs(first, labels)
+    second, second_runs = _runs(second, labels)
+    first_paths, second_paths = _paths_by_ends(
+        first, first_runs), _paths_by_ends(second, second_runs)
+    first_lengths = _lengths(distances, first, first_runs, n_points)
+    second_lengths = _lengths(distances, second, second_runs, n_points)
+    from_second = {component for component, paths in first_paths.items()
+                   if paths.keys() == second_paths.get(component, {}).keys()
+                   and second_lengths[component] < first_lengths[component] - MIN_IMPROVEMENT}
+
+    offspring = []
+    for component, start, end in first_runs:
+        if component not in from_second:
+            offspring.append(first[start:end])
+            continue
+        entry = int(first[start])
+        second_start, second_end = second_paths[component][tuple(
+            sorted((entry, int(first[end - 1]))))]
+        path = second[second_start:second_end]
+        offspring.append(path if path[0] == entry else path[::-1])
+    offspring = np.concatenate(offspring)
+    return offspring[offspring < n_points]
+
+
+def partition_crossover(distances, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Recombines two tours with Generalized Partition Crossover.
+
+    Edges that are only in one of the tours split points into components. Both tours enter and leave a component
+    by the same shared edges, so when they connect its entry points in the same pairs, the component can be passed
+    like in either of the tours. The offspring passes every such component like the tour that is shorter in it,
+    other components are passed like in the first tour.
+    Points with no shared edges are split in two, joined by an edge both tours have, like in GPX2,
+    which breaks large components into smaller ones. Ghosts follow their points in the direction of the tour,
+    so both directions of the second tour are tried. It takes time linear in the number of points.
+    :param first: order of points visited by one tour, the shorter of the tours should be passed here
+    :returns: order of points visited by the offspring, which is never longer than the first tour
+    """
+    offspring = [_offspring(distances, first, second), _offspring(distances, first, second[::-1])]
+    return min(offspring, key=lambda tour: tour_length(distances, tour))
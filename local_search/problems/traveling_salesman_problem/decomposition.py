@@ -0,0 +1,148 @@
+import random
+import time
+from math import ceil, sqrt
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from local_search.algorithms.hill_climbing.dont_look_bits import DontLookBits
+from local_search.problems.base.problem import Problem
+from local_search.problems.traveling_salesman_problem.distance_metrics import EXPLICIT
+from local_search.problems.traveling_salesman_problem.moves.candidate_two_opt import CandidateTwoOpt
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+
+KMEANS_ITERATIONS = 20
+# upper bound on the number of distances between points and centers computed at once
+KMEANS_BATCH_SIZE = 2 ** 22
+
+
+def grid_clusters(coordinates: np.ndarray, n_clusters: int) -> np.ndarray:
+    """
+    Splits bounding box of the points into cells of the same size, every cell with points makes a cluster
+    :returns: cluster of every point, numbered from 0
+    """
+    side = ceil(sqrt(n_clusters))
+    low, high = coordinates.min(axis=0), coordinates.max(axis=0)
+    cells = np.floor((coordinates - low) / np.maximum(high - low, 1e-9) * side)
+    cells = np.clip(cells, 0, side - 1).astype(np.int64)
+    return np.unique(cells[:, 0] * side + cells[:, 1], return_inverse=True)[1]
+
+
+def kmeans_clusters(coordinates: np.ndarray, n_clusters: int) -> np.ndarray:
+    """
+    Groups points with Lloyd's algorithm starting from randomly chosen points
+    :returns: cluster of every point, numbered from 0
+    """
+    rng = np.random.default_rng(random.getrandbits(32))
+    centers = coordinates[rng.choice(
+        len(coordinates), min(n_clusters, len(coordinates)), replace=False)]
+    labels = np.zeros(len(coordinates), dtype=np.int64)
+    rows_in_batch = max(KMEANS_BATCH_SIZE // len(centers), 1)
+    for _ in range(KMEANS_ITERATIONS):
+        for first in range(0, len(coordinates), rows_in_batch):
+            batch = coordinates[first:first + rows_in_batch]
+            labels[first:first + rows_in_batch] = np.argmin(
+                ((batch[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2), axis=1)
+        sizes = np.bincount(labels, minlength=len(centers))
+        sums = np.stack([np.bincount(labels, weights=coordinates[:, axis], minlength=len(centers))
+                         for axis in range(2)], axis=1)
+        # centers that lost all their points stay where they are
+        new_centers = np.where(
+            sizes[:, None] > 0, sums / np.maximum(sizes, 1)[:, None], centers)
+        if np.allclose(new_centers, centers):
+            break
+        centers = new_centers
+    return np.unique(labels, return_inverse=True)[1]
+
+
+CLUSTERINGS: Dict[str, Callable[[np.ndarray, int], np.ndarray]] = {
+    'kmeans': kmeans_clusters,
+    'grid': grid_clusters,
+}
+
+
+def order_clusters(centroids: np.ndarray, first: int) -> List[int]:
+    """
+    Finds short cycle through centroids of clusters with nearest neighbour heuristic improved with 2-opt
+    """
+    lengths = np.hypot(*(centroids[:, None, :] -
+                       centroids[None, :, :]).transpose(2, 0, 1))
+    order, left = [first], set(range(len(centroids))) - {first}
+    while left:
+        order.append(min(left, key=lambda cluster: lengths[order[-1], cluster]))
+        left.remove(order[-1])
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(order) - 1):
+            for j in range(i + 1, len(order)):
+                after = order[(j + 1) % len(order)]
+                delta = lengths[order[i - 1], order[j]] + lengths[order[i], after] \
+                    - lengths[order[i - 1], order[i]] - lengths[order[j], after]
+                if delta < -1e-9:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    improved = True
+    return order
+
+
+def stitch(distances, coordinates: np.ndarray, cycles: List[np.ndarray], order: List[int]) -> np.ndarray:
+    """
+    Joins cycles of clusters visited in the passed order into one cycle.
+
+    Every cycle is cut at one of its edges, so it becomes a path that starts close to the end of the path of
+    the previous cluster and ends close to the centroid of the next one.
+    :returns: points of the joined cycle
+    """
+    centroids = [coordinates[cycle].mean(axis=0) for cycle in cycles]
+    route = []
+    for position, cluster in enumerate(order):
+        cycle = cycles[cluster]
+        if len(cycle) < 2:
+            route.extend(cycle.tolist())
+            continue
+        following = np.roll(cycle, -1)
+        next_centroid = centroids[order[(position + 1) % len(order)]]
+        to_next = np.hypot(*(coordinates[cycle] - next_centroid).T)
+        # the path can enter at either end of the cut edge and leave at the other one
+        entry_cost = np.zeros(len(cycle)) if not route else distances[route[-1], cycle]
+        forward = entry_cost[np.arange(len(cycle)) - len(cycle) + 1] + to_next
+        backward = entry_cost + np.roll(to_next, -1)
+        cut_length = distances[cycle, following]
+        forward, backward = forward - cut_length, backward - cut_length
+        edge = int(np.argmin(np.minimum(forward, backward)))
+        if forward[edge] <= backward[edge]:
+            # enters at the end of the edge and goes forward to its start
+            route.extend(np.roll(cycle, -(edge + 1)).tolist())
+        else:
+            # enters at the start of the edge and goes backward to its end
+            route.extend(np.roll(cycle, -(edge + 1))[::-1].tolist())
+    return np.array(route, dtype=np.int32)
+
+
+def polish(problem: Problem, state: TravelingSalesmanState, boundary: List[int],
+           deadline: float) -> TravelingSalesmanState:
+    """
+    Improves the state in place with candidate 2-opt, looking first only at the passed points
+    and then at points which surroundings changed
+    """
+    move_generator = CandidateTwoOpt(problem.distances, problem.neighbours)
+    dont_look_bits = DontLookBits(boundary)
+    while dont_look_bits and time.time() < deadline:
+        point = dont_look_bits.pop()
+        for move in move_generator.moves_around(state, point):
+            if problem.move_improvement(move) > 0:
+                dont_look_bits.push(point)
+                for touched_point in move_generator.touched_variables(move):
+                    dont_look_bits.push(touched_point)
+                move.apply()
+                break
+    return state
+
+
+def cluster_arguments(distance_metric: str, distances, members: np.ndarray) -> dict:
+    """
+    Returns arguments of the problem limited to the members of a cluster that can't be calculated from its points
+    """
+    if distance_metric == EXPLICIT:
+        return {'distance_metric': EXPLICIT, 'distances': distances[np.ix_(members, members)]}
+    return {'distance_metric': distance_metric}
@@ -0,0 +1,60 @@
+from typing import Callable, Dict
+
+import numpy as np
+
+# radius of the Earth used by TSPLIB GEO instances
+EARTH_RADIUS = 6378.388
+
+
+def euclidean(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    return np.hypot(first[..., 0] - second[..., 0], first[..., 1] - second[..., 1])
+
+
+def euc_2d(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    return np.floor(euclidean(first, second) + 0.5)
+
+
+def ceil_2d(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    return np.ceil(euclidean(first, second))
+
+
+def att(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Pseudo-euclidean distance of TSPLIB ATT instances
+    """
+    distance = euclidean(first, second) / np.sqrt(10)
+    rounded = np.floor(distance + 0.5)
+    return np.where(rounded < distance, rounded + 1, rounded)
+
+
+def _to_radians(coordinates: np.ndarray) -> np.ndarray:
+    # TSPLIB GEO coordinates are written as DDD.MM - degrees and minutes
+    degrees = np.trunc(coordinates)
+    return 3.141592 * (degrees + 5.0 * (coordinates - degrees) / 3.0) / 180.0
+
+
+def geo(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Great circle distance of TSPLIB GEO instances, coordinates are latitude and longitude
+    """
+    first, second = _to_radians(first), _to_radians(second)
+    q1 = np.cos(first[..., 1] - second[..., 1])
+    q2 = np.cos(first[..., 0] - second[..., 0])
+    q3 = np.cos(first[..., 0] + second[..., 0])
+    cosine = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+    return np.trunc(EARTH_RADIUS * np.arccos(cosine) + 1.0)
+
+
+DISTANCE_METRICS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    'euclidean': euclidean,
+    'euc_2d': euc_2d,
+    'ceil_2d': ceil_2d,
+    'att': att,
+    'geo': geo,
+}
+
+# metrics that grow with the euclidean distance, so nearest neighbours can be found on the plane
+PLANAR_METRICS = {'euclidean', 'euc_2d', 'ceil_2d', 'att'}
+
+# distances are given explicitly instead of being calculated from coordinates
+EXPLICIT = 'explicit'
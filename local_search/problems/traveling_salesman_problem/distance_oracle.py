@@ -0,0 +1,112 @@
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.distance_metrics import DISTANCE_METRICS
+
+# number of rows of the distance matrix kept in memory
+CACHED_ROWS = 256
+# number of distances of a point computed one by one after which its whole row is computed and kept
+MIN_ACCESSES_OF_HOT_POINT = 16
+# computing a row takes about as long as computing this many distances one by one,
+# so the row is computed when the point has taken that much time already
+DISTANCES_PER_ROW = 1 / 32
+
+_INDEX_TYPES = (int, np.integer)
+
+
+class DistanceOracle:
+    """
+    Distances between points computed when they are needed, used instead of distance matrix that wouldn't fit in memory.
+
+    Supports the same indexing as the matrix - by a pair of points or by arrays of points that are broadcast
+    against each other - so goals and move generators use it without knowing that there is no matrix.
+    Distances between points and their nearest neighbours are computed once and kept. Whole rows of points that
+    are accessed often are kept in LRU cache, other distances are computed on every access.
+    """
+
+    def __init__(self, coordinates: np.ndarray, distance_metric: str, cached_rows: int = CACHED_ROWS):
+        self.coordinates = coordinates
+        self._metric = DISTANCE_METRICS[distance_metric]
+        self._n_points = len(coordinates)
+        self._pairs: Dict[int, float] = {}
+        self._rows: Dict[int, np.ndarray] = OrderedDict()
+        self._cached_rows = cached_rows
+        self._accesses = np.zeros(self._n_points, dtype=np.int32)
+        # some metrics, like TSPLIB GEO, don't give 0 for the same point
+        self._fix_diagonal = len(coordinates) > 0 and \
+            bool(self._metric(coordinates[0], coordinates[0]) != 0)
+        self._accesses_of_hot_point = max(
+            MIN_ACCESSES_OF_HOT_POINT, int(self._n_points * DISTANCES_PER_ROW))
+
+    def __len__(self) -> int:
+        return self._n_points
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._n_points, self._n_points
+
+    def remember_neighbours(self, neighbours: np.ndarray):
+        """
+        Computes and keeps distances between every point and its nearest neighbours
+        """
+        starts = np.repeat(np.arange(self._n_points, dtype=np.int64),
+                           neighbours.shape[1])
+        ends = neighbours.ravel().astype(np.int64)
+        keys = np.minimum(starts, ends) * self._n_points + \
+            np.maximum(starts, ends)
+        self._pairs.update(
+            zip(keys.tolist(), self._compute(starts, ends).tolist()))
+
+    def _compute(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        distances = self._metric(
+            self.coordinates[starts], self.coordinates[ends])
+        if self._fix_diagonal:
+            return np.where(starts == ends, 0.0, distances)
+        return distances
+
+    def _row(self, point: int) -> Union[np.ndarray, None]:
+        row = self._rows.get(point)
+        if row is not None:
+            self._rows.move_to_end(point)
+        return row
+
+    def _cache_row(self, point: int) -> np.ndarray:
+        row = self._compute(np.int64(point), np.arange(self._n_points))
+        self._rows[point] = row
+        if len(self._rows) > self._cached_rows:
+            self._rows.popitem(last=False)
+        return row
+
+    def _distance(self, start: int, end: int) -> float:
+        if start == end:
+            return 0.0
+        key = start * self._n_points + end if start < end else end * self._n_points + start
+        distance = self._pairs.get(key)
+        if distance is not None:
+            return distance
+        for point, other in ((start, end), (end, start)):
+            row = self._row(point)
+            if row is not None:
+                return float(row[other])
+        for point, other in ((start, end), (end, start)):
+            self._accesses[point] += 1
+            if self._accesses[point] >= self._accesses_of_hot_point:
+                self._accesses[point] = 0
+                return float(self._cache_row(point)[other])
+        return float(self._metric(self.coordinates[start], self.coordinates[end]))
+
+    def __getitem__(self, key) -> Union[float, np.ndarray]:
+        starts, ends = key
+        if isinstance(starts, _INDEX_TYPES):
+            if isinstance(ends, _INDEX_TYPES):
+                return self._distance(int(starts), int(ends))
+            row = self._row(int(starts))
+            if row is not None:
+                return row[ends]
+        elif isinstance(ends, _INDEX_TYPES):
+            row = self._row(int(ends))
+            if row is not None:
+                return row[starts]
+        return self._compute(np.asarray(starts), np.asarray(ends))
@@ -1,12 +1,14 @@
 from abc import ABC
-from typing import List
+from typing import List, Union
 
+import numpy as np
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.goal import GoalType
+from local_search.problems.base.moves import Move
 from local_search.problems.base.problem import Goal
 from local_search.problems.traveling_salesman_problem.models import Point
-from local_search.problems.traveling_salesman_problem.models.salesman import \
-    Salesman
+from local_search.problems.traveling_salesman_problem.moves.move import \
+    TravelingSalesmanMove
 from local_search.problems.traveling_salesman_problem.state import \
     TravelingSalesmanState
 
@@ -17,8 +19,9 @@ class TravelingSalesmanGoal(Goal, ABC):
     """
     goals = {}
 
-    def __init__(self, points: List[Point]):
+    def __init__(self, points: List[Point], distances: np.ndarray):
         self._points = points
+        self._distances = distances
 
     def __init_subclass__(cls):
         TravelingSalesmanGoal.goals[camel_to_snake(cls.__name__)] = cls
@@ -27,11 +30,17 @@ class TravelingSalesmanGoal(Goal, ABC):
 class Distance(TravelingSalesmanGoal):
 
     def objective_for(self, state: TravelingSalesmanState) -> int:
-        route = [self._points[i]
-                 for i in state.route]
-        return int(Salesman.from_point(route[0])
-                           .walk_route(route)
-                           .travelled_distance)
+        route = np.asarray(state.route)
+        return int(self._distances[route[:-1], route[1:]].sum())
+
+    def objective_delta_for(self, move: Move) -> Union[float, None]:
+        if not isinstance(move, TravelingSalesmanMove):
+            return None
+        added = sum(self._distances[start, end]
+                    for start, end in move.added_edges())
+        removed = sum(self._distances[start, end]
+                      for start, end in move.removed_edges())
+        return float(added - removed)
 
     def human_readable_objective_for(self, state: TravelingSalesmanState) -> str:
         return f"{self.objective_for(state)} km"
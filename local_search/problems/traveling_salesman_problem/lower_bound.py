@@ -0,0 +1,94 @@
+from time import time
+from typing import Tuple, Union
+
+import numpy as np
+
+# number of iterations without improvement of the bound after which the step is halved
+PATIENCE = 20
+MIN_STEP_SCALE = 1e-3
+
+
+def _minimum_spanning_tree(weights: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Finds minimum spanning tree of complete graph with Prim's algorithm.
+    :returns: cost of the tree and parent of every vertex, the first vertex is the root and has no parent
+    """
+    n_vertices = len(weights)
+    in_tree = np.zeros(n_vertices, dtype=bool)
+    in_tree[0] = True
+    parents = np.zeros(n_vertices, dtype=np.int64)
+    parents[0] = -1
+    closest = weights[0].copy()
+    closest[0] = np.inf
+    cost = 0.0
+    for _ in range(n_vertices - 1):
+        vertex = int(np.argmin(closest))
+        cost += closest[vertex]
+        in_tree[vertex] = True
+        closest[vertex] = np.inf
+        closer = (weights[vertex] < closest) & ~in_tree
+        closest[closer] = weights[vertex][closer]
+        parents[closer] = vertex
+    return cost, parents
+
+
+def _one_tree(distances: np.ndarray, penalties: np.ndarray, weights: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Finds minimum 1-tree - spanning tree of all points but the first one, connected with the first point by two edges.
+    :param weights: buffer of the shape of distances, filled with penalized distances
+    :returns: cost of the 1-tree with penalized distances and degrees of the points in it
+    """
+    np.add(distances, penalties[:, None], out=weights)
+    weights += penalties[None, :]
+    cost, parents = _minimum_spanning_tree(weights[1:, 1:])
+    degrees = np.bincount(parents[1:], minlength=len(parents)) + 1
+    degrees[0] -= 1
+    nearest = np.argpartition(weights[0, 1:], 1)[:2]
+    cost += weights[0, 1:][nearest].sum()
+    degrees = np.concatenate(([2], degrees))
+    degrees[nearest + 1] += 1
+    return cost, degrees
+
+
+def held_karp_bound(distances: np.ndarray, upper_bound: float, max_iterations: int = 1000,
+                    time_limit: Union[float, None] = None) -> float:
+    """
+    Calculates Held-Karp lower bound on the length of the shortest route with subgradient optimization.
+
+    Every point gets a penalty that is added to the lengths of its edges, which doesn't change the shortest route,
+    but changes the minimum 1-tree. Penalties of points with more than two edges in the 1-tree grow and penalties
+    of leaves decrease, so that the 1-tree becomes more similar to a route.
+    :param upper_bound: length of any route, used to choose the size of steps
+    :param time_limit: seconds after which the best bound found so far is returned, None means no limit
+    """
+    n_points = len(distances)
+    if n_points < 3:
+        return float(distances[0, -1] * 2)
+    deadline = None if time_limit is None else time() + time_limit
+    penalties = np.zeros(n_points)
+    # penalized distances of every iteration are written to the same matrix
+    weights = np.empty_like(distances, dtype=np.float64)
+    best_bound = -np.inf
+    step_scale = 2.0
+    iterations_without_improvement = 0
+    for _ in range(max_iterations):
+        cost, degrees = _one_tree(distances, penalties, weights)
+        bound = cost - 2 * penalties.sum()
+        if bound > best_bound:
+            best_bound, iterations_without_improvement = bound, 0
+        else:
+            iterations_without_improvement += 1
+            if iterations_without_improvement == PATIENCE:
+                step_scale, iterations_without_improvement = step_scale / 2, 0
+                if step_scale < MIN_STEP_SCALE:
+                    break
+        subgradient = degrees - 2
+        norm = np.dot(subgradient, subgradient)
+        # 1-tree in which every point has two edges is the shortest route
+        if norm == 0 or bound >= upper_bound:
+            break
+        # every 1-tree gives a valid bound, so the ascent can stop at any iteration
+        if deadline is not None and time() > deadline:
+            break
+        penalties += step_scale * (upper_bound - bound) / norm * subgradient
+    return float(best_bound)
@@ -1,2 +1,6 @@
 from local_search.problems.traveling_salesman_problem.moves.swap_two_points import SwapTwoPoints
 from local_search.problems.traveling_salesman_problem.moves.two_opt import TwoOpt
+from local_search.problems.traveling_salesman_problem.moves.candidate_two_opt import CandidateTwoOpt
+from local_search.problems.traveling_salesman_problem.moves.or_opt import OrOpt
+from local_search.problems.traveling_salesman_problem.moves.lin_kernighan import LinKernighan
+from local_search.problems.traveling_salesman_problem.moves.window_reoptimization import WindowReoptimization
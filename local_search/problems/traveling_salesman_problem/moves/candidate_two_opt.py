@@ -0,0 +1,50 @@
+import random
+from typing import Generator, Iterable, Union
+
+from local_search.problems.base.move_generator import LocalMoveGenerator
+from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
+from local_search.problems.traveling_salesman_problem.moves.two_opt import TwoOptMove
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+
+
+class CandidateTwoOpt(TravelingSalesmanMoveGenerator, LocalMoveGenerator):
+    """
+    2-opt restricted to moves that connect a point with one of its nearest neighbours.
+
+    For point `a` and its neighbour `c` there are two such moves:
+    one replaces edges (a, next(a)), (c, next(c)) with (a, c), (next(a), next(c)),
+    the other replaces edges (prev(a), a), (prev(c), c) with (a, c), (prev(a), prev(c)).
+    """
+
+    def _successor_move(self, state: TravelingSalesmanState, a: int, c: int) -> Union[TwoOptMove, None]:
+        a_next = state.next(a)
+        if c == a_next or c == state.prev(a):
+            return None
+        return TwoOptMove(state, a_next, c)
+
+    def _predecessor_move(self, state: TravelingSalesmanState, a: int, c: int) -> Union[TwoOptMove, None]:
+        c_prev = state.prev(c)
+        if c_prev == a or c == state.prev(a):
+            return None
+        return TwoOptMove(state, a, c_prev)
+
+    def variables(self, state: TravelingSalesmanState) -> Iterable[int]:
+        return range(len(self.neighbours))
+
+    def moves_around(self, state: TravelingSalesmanState, a: int) -> Generator[TwoOptMove, None, None]:
+        for c in self.neighbours[a]:
+            for move in (self._successor_move(state, a, c), self._predecessor_move(state, a, c)):
+                if move is not None:
+                    yield move
+
+    def touched_variables(self, move: TwoOptMove) -> Iterable[int]:
+        return {int(point) for edge in move.removed_edges() for point in edge}
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[TwoOptMove, None, None]:
+        create_move = (self._successor_move, self._predecessor_move)
+        while True:
+            a = random.randrange(len(self.neighbours))
+            move = random.choice(create_move)(
+                state, a, random.choice(self.neighbours[a]))
+            if move is not None:
+                yield move
@@ -0,0 +1,132 @@
+import random
+from typing import Generator, List, Tuple, Union
+
+from local_search.problems.traveling_salesman_problem.moves.candidate_two_opt import CandidateTwoOpt
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
+from local_search.problems.traveling_salesman_problem.moves.two_opt import TwoOptMove
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+
+
+class LinKernighanMove(TravelingSalesmanMove):
+    """
+    Sequence of 2-opt moves that are applied one after another.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState, steps: List[TwoOptMove],
+                 removed: List[Tuple[int, int]], added: List[Tuple[int, int]]):
+        super().__init__(from_state)
+        self.steps = steps
+        self._removed = removed
+        self._added = added
+
+    def _apply_to(self, state: TravelingSalesmanState):
+        for step in self.steps:
+            step._apply_to(state)
+
+    def _undo_on(self, state: TravelingSalesmanState):
+        for step in reversed(self.steps):
+            step._undo_on(state)
+
+    def removed_edges(self) -> List[Tuple[int, int]]:
+        return self._removed
+
+    def added_edges(self) -> List[Tuple[int, int]]:
+        return self._added
+
+
+class LinKernighan(CandidateTwoOpt):
+    """
+    Variable depth search in the style of Lin-Kernighan.
+
+    Point t1 stays fixed while edge (t1, t2) is broken and t2 is connected to one of its nearest neighbours t3.
+    One of the edges of t3 is broken to close the route again, which makes a 2-opt move, and the search
+    continues from the new edge of t1 for as long as the removed edges are longer than the added ones.
+    The move consists of the steps that gave the shortest route.
+    """
+    MAX_DEPTH = 10
+
+    def _step(self, state: TravelingSalesmanState, t1: int, t2: int, t3: int) -> Union[Tuple[TwoOptMove, int], None]:
+        """
+        Creates 2-opt move that replaces edges (t1, t2), (t3, t4) with (t2, t3), (t4, t1)
+        :returns: the move with t4, or None if there is no such move
+        """
+        if t2 == state.next(t1):
+            move, t4 = self._predecessor_move(state, t2, t3), state.prev(t3)
+        else:
+            move, t4 = self._successor_move(state, t2, t3), state.next(t3)
+        return None if move is None else (move, t4)
+
+    def _chain(self, state: TravelingSalesmanState, t1: int, t2: int, t3: int) -> Union[LinKernighanMove, None]:
+        """
+        Applies 2-opt moves starting from the one that connects t2 with t3, then reverts them
+        """
+        first_step = self._step(state, t1, t2, t3)
+        if first_step is None:
+            return None
+        steps, removed, added = [], [(t1, t2)], []
+        # removed edges can't be added back and added edges can't be removed
+        forbidden = {frozenset((t1, t2))}
+        gain = self.distances[t1, t2]
+        best_depth, best_delta, best_t4 = 0, float('inf'), None
+        step = first_step
+        while step is not None:
+            move, t4 = step
+            move.apply()
+            steps.append(move)
+            removed.append((t3, t4))
+            added.append((t2, t3))
+            forbidden.update((frozenset((t3, t4)), frozenset((t2, t3))))
+            gain += self.distances[t3, t4] - self.distances[t2, t3]
+            delta = self.distances[t4, t1] - gain
+            if delta < best_delta:
+                best_depth, best_delta, best_t4 = len(steps), delta, t4
+            if len(steps) == self.MAX_DEPTH:
+                break
+            t2 = t4
+            step, t3 = self._next_step(state, t1, t2, gain, forbidden)
+        for move in reversed(steps):
+            move.undo()
+        return LinKernighanMove(state, steps[:best_depth], removed[:best_depth + 1],
+                                added[:best_depth] + [(best_t4, t1)])
+
+    def _next_step(self, state: TravelingSalesmanState, t1: int, t2: int, gain: float,
+                   forbidden: set) -> Tuple[Union[Tuple[TwoOptMove, int], None], Union[int, None]]:
+        """
+        Chooses the step that keeps the gain positive and makes it the largest
+        """
+        forward = t2 == state.next(t1)
+        best_t3, best_gain = None, 0
+        for t3 in self.neighbours[t2]:
+            t3 = int(t3)
+            gain_after_adding = gain - self.distances[t2, t3]
+            # neighbours are sorted from the nearest one, so the following ones can't keep the gain positive
+            if gain_after_adding <= 0:
+                break
+            t4 = state.prev(t3) if forward else state.next(t3)
+            # t3 next to t2 or t1 doesn't make a 2-opt move
+            if t3 == t1 or t4 == t2 or frozenset((t2, t3)) in forbidden or frozenset((t3, t4)) in forbidden:
+                continue
+            new_gain = gain_after_adding + self.distances[t3, t4]
+            if new_gain > best_gain:
+                best_t3, best_gain = t3, new_gain
+        if best_t3 is None:
+            return None, None
+        return self._step(state, t1, t2, best_t3), best_t3
+
+    def moves_around(self, state: TravelingSalesmanState, t1: int) -> Generator[LinKernighanMove, None, None]:
+        for t2 in (state.next(t1), state.prev(t1)):
+            for t3 in self.neighbours[t2]:
+                if self.distances[t1, t2] <= self.distances[t2, t3]:
+                    break
+                move = self._chain(state, t1, t2, int(t3))
+                if move is not None:
+                    yield move
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[LinKernighanMove, None, None]:
+        while True:
+            t1 = random.randrange(len(self.neighbours))
+            t2 = random.choice((state.next(t1), state.prev(t1)))
+            move = self._chain(state, t1, t2, int(
+                random.choice(self.neighbours[t2])))
+            if move is not None:
+                yield move
@@ -0,0 +1,81 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
+
+from local_search.problems.base import ReversibleMove
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+from local_search.problems.traveling_salesman_problem.zobrist import edges_hash
+
+
+class TravelingSalesmanMove(ReversibleMove[TravelingSalesmanState], ABC):
+    """
+    Base class for moves of the traveling salesman problem.
+
+    Every move replaces a few edges of the route with other ones,
+    so its cost can be calculated from these edges only.
+    Edges are described with respect to the state before the move is applied,
+    they also keep hash of the route up to date.
+    """
+    _hash_change: Union[int, None] = None
+
+    def hash_change(self) -> int:
+        """
+        Returns value that turns hash of the route before the move into hash after the move with xor and vice versa
+        """
+        if self._hash_change is None:
+            self._hash_change = edges_hash(
+                self.removed_edges()) ^ edges_hash(self.added_edges())
+        return self._hash_change
+
+    def _update_hash(self, state: TravelingSalesmanState):
+        if state._hash is None:
+            return
+        if self._hash_change is None:
+            # edges of the route before the move can't be read anymore
+            state._hash = None
+        else:
+            state._hash ^= self._hash_change
+
+    def make(self) -> TravelingSalesmanState:
+        new_state = self.state.copy()
+        if new_state._hash is not None:
+            self.hash_change()
+        self._apply_to(new_state)
+        self._update_hash(new_state)
+        return new_state
+
+    def apply(self) -> TravelingSalesmanState:
+        if self.state._hash is not None:
+            # some moves read edges from the route, so they have to be read before it changes
+            self.hash_change()
+        self._apply_to(self.state)
+        self._update_hash(self.state)
+        return self.state
+
+    def undo(self) -> TravelingSalesmanState:
+        self._undo_on(self.state)
+        self._update_hash(self.state)
+        return self.state
+
+    @abstractmethod
+    def _apply_to(self, state: TravelingSalesmanState):
+        """
+        Modifies route of passed state in place
+        """
+
+    @abstractmethod
+    def _undo_on(self, state: TravelingSalesmanState):
+        """
+        Reverts modifications made by `_apply_to` on passed state
+        """
+
+    @abstractmethod
+    def removed_edges(self) -> List[Tuple[int, int]]:
+        """
+        Returns edges (pairs of point indices) that the move removes from the route
+        """
+
+    @abstractmethod
+    def added_edges(self) -> List[Tuple[int, int]]:
+        """
+        Returns edges (pairs of point indices) that the move adds to the route
+        """
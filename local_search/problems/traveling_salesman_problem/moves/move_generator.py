@@ -1,8 +1,12 @@
 from abc import ABC
+from typing import Tuple, Union
 
+import numpy as np
 from local_search.helpers.camel_to_snake import camel_to_snake
 
 from local_search.problems.base.move_generator import MoveGenerator
+from local_search.problems.base.moves import Move
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 
 
 class TravelingSalesmanMoveGenerator(MoveGenerator, ABC):
@@ -12,4 +16,15 @@ class TravelingSalesmanMoveGenerator(MoveGenerator, ABC):
     move_generators = {}
 
     def __init_subclass__(cls):
-        TravelingSalesmanMoveGenerator.move_generators[camel_to_snake(cls.__name__)] = cls
\ No newline at end of file
+        TravelingSalesmanMoveGenerator.move_generators[camel_to_snake(cls.__name__)] = cls
+
+    def __init__(self, distances: np.ndarray, neighbours: np.ndarray):
+        self.distances = distances
+        self.neighbours = neighbours
+
+    def best_move(self, state: TravelingSalesmanState) -> Union[Tuple[Move[TravelingSalesmanState], float], None]:
+        """
+        Finds the move that shortens the route the most, evaluating all moves at once.
+        :returns: the move with the change of route length it causes, or None if the generator doesn't support it
+        """
+        return None
@@ -0,0 +1,113 @@
+import random
+from typing import Generator, Iterable, List, Tuple, Union
+
+from local_search.problems.base.move_generator import LocalMoveGenerator
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
+from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+
+
+class OrOptMove(TravelingSalesmanMove):
+    """
+    Moves segment route[start:end] between points at indices `after` and `after + 1`, optionally reversing it.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState, start: int, end: int, after: int, reverse: bool):
+        super().__init__(from_state)
+        (self.start, self.end, self.after, self.reverse) = start, end, after, reverse
+
+    def _apply_to(self, state: TravelingSalesmanState):
+        state.move_segment(self.start, self.end, self.after, self.reverse)
+
+    def _undo_on(self, state: TravelingSalesmanState):
+        length = self.end - self.start
+        if self.after >= self.end:
+            state.move_segment(self.after - length + 1,
+                               self.after + 1, self.start - 1, self.reverse)
+        else:
+            state.move_segment(self.after + 1, self.after + 1 + length,
+                               self.end - 1, self.reverse)
+
+    def removed_edges(self) -> List[Tuple[int, int]]:
+        point_at = self.state.point_at
+        return [(point_at(self.start - 1), point_at(self.start)),
+                (point_at(self.end - 1), point_at(self.end)),
+                (point_at(self.after), point_at(self.after + 1))]
+
+    def added_edges(self) -> List[Tuple[int, int]]:
+        point_at = self.state.point_at
+        first, last = point_at(self.start), point_at(self.end - 1)
+        if self.reverse:
+            first, last = last, first
+        return [(point_at(self.start - 1), point_at(self.end)),
+                (point_at(self.after), first),
+                (last, point_at(self.after + 1))]
+
+
+class OrOpt(TravelingSalesmanMoveGenerator, LocalMoveGenerator):
+    """
+    Moves segments of 1 to `MAX_SEGMENT_LENGTH` points to another place in the route, optionally reversed.
+
+    Segment is moved only next to one of the nearest neighbours of its first or last point.
+    """
+    MAX_SEGMENT_LENGTH = 3
+
+    def _move(self, state: TravelingSalesmanState, start: int, end: int, endpoint: int,
+              neighbour: int, before_neighbour: bool) -> Union[OrOptMove, None]:
+        """
+        Creates move that places segment's endpoint (first or last point) next to the neighbour,
+        either right before it or right after it.
+        """
+        is_first = endpoint == state.point_at(start)
+        position = state.positions[neighbour]
+        if before_neighbour:
+            # the depot precedes the closing copy of itself at the end of the route
+            after = (position or state.n_points) - 1
+            reverse = is_first
+        else:
+            after = position
+            reverse = not is_first
+        if start - 1 <= after <= end - 1:
+            return None
+        return OrOptMove(state, start, end, int(after), reverse)
+
+    def _is_movable(self, state: TravelingSalesmanState, start: int, end: int) -> bool:
+        # the depot has to stay at both ends of the route
+        return 1 <= start < end <= state.n_points
+
+    def variables(self, state: TravelingSalesmanState) -> Iterable[int]:
+        return range(len(self.neighbours))
+
+    def moves_around(self, state: TravelingSalesmanState, point: int) -> Generator[OrOptMove, None, None]:
+        position = int(state.positions[point])
+        for length in range(1, self.MAX_SEGMENT_LENGTH + 1):
+            for start in {position, position - length + 1}:
+                end = start + length
+                if not self._is_movable(state, start, end):
+                    continue
+                for endpoint in {state.point_at(start), state.point_at(end - 1)}:
+                    for neighbour in self.neighbours[endpoint]:
+                        for before_neighbour in (False, True):
+                            move = self._move(
+                                state, start, end, endpoint, neighbour, before_neighbour)
+                            if move is not None:
+                                yield move
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[OrOptMove, None, None]:
+        while True:
+            point = random.randrange(len(self.neighbours))
+            length = random.randint(1, self.MAX_SEGMENT_LENGTH)
+            start = int(state.positions[point]) - \
+                random.choice((0, length - 1))
+            end = start + length
+            if not self._is_movable(state, start, end):
+                continue
+            endpoint = state.point_at(random.choice((start, end - 1)))
+            move = self._move(state, start, end, endpoint,
+                              random.choice(self.neighbours[endpoint]),
+                              random.random() < 0.5)
+            if move is not None:
+                yield move
+
+    def touched_variables(self, move: OrOptMove) -> Iterable[int]:
+        return {int(point) for edge in move.removed_edges() for point in edge}
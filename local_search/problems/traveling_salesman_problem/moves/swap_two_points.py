@@ -1,34 +1,54 @@
-from copy import copy
-from typing import Generator, List
+from typing import Generator, List, Tuple
 
 from local_search.problems.base import Move
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
 from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 import random
 
 
-class SwapTwoPointsMove(Move[TravelingSalesmanState]):
+class SwapTwoPointsMove(TravelingSalesmanMove):
 
     def __init__(self, from_state: TravelingSalesmanState, i1: int, i2: int):
         super().__init__(from_state)
         (self.i1, self.i2) = i1, i2
 
-    def make(self) -> TravelingSalesmanState:
-        new_route = copy(self.state.route)
-        new_route[self.i1] = self.state.route[self.i2]
-        new_route[self.i2] = self.state.route[self.i1]
-        return TravelingSalesmanState(new_route, self.state.points)
+    def _apply_to(self, state: TravelingSalesmanState):
+        state.swap(self.i1, self.i2)
+
+    def _undo_on(self, state: TravelingSalesmanState):
+        self._apply_to(state)
+
+    def _points_around(self) -> Tuple[int, int, int, int, int, int]:
+        """
+        Returns swapped points and their neighbours in the route: before i1, i1, after i1, before i2, i2, after i2
+        """
+        point_at = self.state.point_at
+        return (point_at(self.i1 - 1), point_at(self.i1), point_at(self.i1 + 1),
+                point_at(self.i2 - 1), point_at(self.i2), point_at(self.i2 + 1))
+
+    def removed_edges(self) -> List[Tuple[int, int]]:
+        before1, point1, after1, before2, point2, after2 = self._points_around()
+        if self.i2 == self.i1 + 1:
+            return [(before1, point1), (point2, after2)]
+        return [(before1, point1), (point1, after1), (before2, point2), (point2, after2)]
+
+    def added_edges(self) -> List[Tuple[int, int]]:
+        before1, point1, after1, before2, point2, after2 = self._points_around()
+        if self.i2 == self.i1 + 1:
+            return [(before1, point2), (point1, after2)]
+        return [(before1, point2), (point2, after1), (before2, point1), (point1, after2)]
 
 
 class SwapTwoPoints(TravelingSalesmanMoveGenerator):
 
     def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
-        for i1 in range(1, len(state.route) - 2):
-            for i2 in range(i1 + 1, len(state.route) - 1):
+        for i1 in range(1, state.n_points - 1):
+            for i2 in range(i1 + 1, state.n_points):
                 yield SwapTwoPointsMove(state, i1, i2)
 
     def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
         while True:
-            i1 = random.randrange(1, len(state.route) - 2)
-            i2 = random.randrange(i1 + 1, len(state.route) - 1)
+            i1 = random.randrange(1, state.n_points - 1)
+            i2 = random.randrange(i1 + 1, state.n_points)
             yield SwapTwoPointsMove(state, i1, i2)
@@ -1,33 +1,82 @@
-from copy import copy
-from typing import Generator
+from typing import Generator, List, Tuple, Union
+
+import numpy as np
 
 from local_search.problems.base import Move
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
 from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 import random
 
-class TwoOptMove(Move[TravelingSalesmanState]):
+class TwoOptMove(TravelingSalesmanMove):
+    """
+    Reverses path of the route that goes from point `first` to point `last`.
+    """
 
-    def __init__(self, from_state: TravelingSalesmanState, i1: int, i2: int):
+    def __init__(self, from_state: TravelingSalesmanState, first: int, last: int):
         super().__init__(from_state)
-        (self.i1, self.i2) = i1, i2
+        (self.first, self.last) = first, last
+        (self.before, self.after) = from_state.prev(first), from_state.next(last)
+
+    def _apply_to(self, state: TravelingSalesmanState):
+        # states may change direction of the route when reversing, so the path is found by its neighbours
+        if state.next(self.before) == self.first:
+            state.reverse_path(self.first, self.last)
+        else:
+            state.reverse_path(self.last, self.first)
+
+    def _undo_on(self, state: TravelingSalesmanState):
+        if state.next(self.before) == self.last:
+            state.reverse_path(self.last, self.first)
+        else:
+            state.reverse_path(self.first, self.last)
+
+    def removed_edges(self) -> List[Tuple[int, int]]:
+        return [(self.before, self.first), (self.last, self.after)]
 
-    def make(self) -> TravelingSalesmanState:
-        new_route = self.state.route[0:self.i1] + list(reversed(self.state.route[self.i1:self.i2])) + self.state.route[self.i2:]
-        return TravelingSalesmanState(new_route, self.state.points)
+    def added_edges(self) -> List[Tuple[int, int]]:
+        return [(self.before, self.last), (self.first, self.after)]
 
 class TwoOpt(TravelingSalesmanMoveGenerator):
+    # upper bound on the number of moves evaluated at once by `best_move`
+    BATCH_SIZE = 2 ** 22
+
+    def _move(self, state: TravelingSalesmanState, i1: int, i2: int) -> TwoOptMove:
+        """
+        Creates move that reverses route[i1:i2]
+        """
+        return TwoOptMove(state, state.point_at(i1), state.point_at(i2 - 1))
 
     def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
-        for i1 in range(1, len(state.route) - 2):
-            for i2 in range(i1 + 1, len(state.route) - 1):
-                yield TwoOptMove(state, i1, i2)
+        for i1 in range(1, state.n_points - 1):
+            for i2 in range(i1 + 1, state.n_points):
+                yield self._move(state, i1, i2)
 
     def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
         while True:
-            i1 = random.randrange(1, len(state.route) - 2)
-            i2 = random.randrange(i1 + 1, len(state.route) - 1)
-            yield TwoOptMove(state, i1, i2)
-
-
+            i1 = random.randrange(1, state.n_points - 1)
+            i2 = random.randrange(i1 + 1, state.n_points)
+            yield self._move(state, i1, i2)
 
+    def best_move(self, state: TravelingSalesmanState) -> Union[Tuple[TwoOptMove, float], None]:
+        # move (i1, i2) replaces edges starting at a = i1 - 1 and b = i2 - 1 of the route,
+        # i.e. (route[a], route[a + 1]), (route[b], route[b + 1]) with (route[a], route[b]), (route[a + 1], route[b + 1])
+        n_edges = len(state.route) - 2
+        if n_edges < 3:
+            return None
+        starts, ends = state.route[:n_edges], state.route[1:n_edges + 1]
+        edges_lengths = self.distances[starts, ends]
+        best_a, best_b, best_delta = None, None, np.inf
+        rows_in_batch = max(1, self.BATCH_SIZE // n_edges)
+        for first_row in range(0, n_edges, rows_in_batch):
+            rows = np.arange(first_row, min(first_row + rows_in_batch, n_edges))
+            deltas = (self.distances[np.ix_(starts[rows], starts)] + self.distances[np.ix_(ends[rows], ends)]) \
+                - (edges_lengths[rows, None] + edges_lengths[None, :])
+            # only b > a + 1 gives a move that changes the route
+            deltas[rows[:, None] + 1 >= np.arange(n_edges)[None, :]] = np.inf
+            row, b = np.unravel_index(np.argmin(deltas), deltas.shape)
+            if deltas[row, b] < best_delta:
+                best_a, best_b, best_delta = rows[row], b, deltas[row, b]
+        if best_a is None:
+            return None
+        return self._move(state, int(best_a) + 1, int(best_b) + 1), float(best_delta)
@@ -0,0 +1,99 @@
+import random
+from typing import Generator, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from local_search.problems.base.move_generator import LocalMoveGenerator
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
+from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+from local_search.problems.traveling_salesman_problem.window_optimization import shortest_path_through
+
+
+class ReorderMove(TravelingSalesmanMove):
+    """
+    Visits points of route[start:start + len(order)] in the passed order.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState, start: int, order: np.ndarray):
+        super().__init__(from_state)
+        self.start = start
+        self.order = np.asarray(order, dtype=np.int32)
+        route = from_state.route
+        self.old_order = route[start:start + len(order)].copy()
+        (self.before, self.after) = int(route[start - 1]), int(route[start + len(order)])
+
+    def _apply_to(self, state: TravelingSalesmanState):
+        state.reorder(self.start, self.order)
+
+    def _undo_on(self, state: TravelingSalesmanState):
+        state.reorder(self.start, self.old_order)
+
+    def _path_edges(self, order: np.ndarray) -> List[Tuple[int, int]]:
+        path = [self.before, *order.tolist(), self.after]
+        return list(zip(path[:-1], path[1:]))
+
+    def removed_edges(self) -> List[Tuple[int, int]]:
+        return self._path_edges(self.old_order)
+
+    def added_edges(self) -> List[Tuple[int, int]]:
+        return self._path_edges(self.order)
+
+
+class WindowReoptimization(TravelingSalesmanMoveGenerator, LocalMoveGenerator):
+    """
+    Visits `WINDOW_SIZE` consecutive points of the route in the best possible order.
+
+    Points just before and just after the window stay in place, and the shortest path between them
+    through the points of the window is found exactly with Held-Karp dynamic programming.
+    The window that starts at a point gives a move only when it shortens the route.
+    """
+    WINDOW_SIZE = 10
+    # smallest shortening of the route that counts as an improvement, smaller ones come from rounding
+    MIN_IMPROVEMENT = 1e-9
+
+    def window_size(self, state: TravelingSalesmanState) -> int:
+        # the depot stays at both ends of the route
+        return min(self.WINDOW_SIZE, len(state.route) - 2)
+
+    def window_start(self, state: TravelingSalesmanState, position: int) -> int:
+        """
+        Returns start of the window that begins at the position, moved so that the window fits in the route
+        """
+        return max(min(position, len(state.route) - 1 - self.window_size(state)), 1)
+
+    def reoptimize(self, state: TravelingSalesmanState, start: int) -> Union[ReorderMove, None]:
+        """
+        Creates move that visits points of the window that starts at the index in the best order
+        :returns: the move, or None if the points are already visited in the best order
+        """
+        path = state.route[start - 1:start + self.window_size(state) + 1]
+        distances = np.asarray(self.distances[np.ix_(path, path)])
+        order, length = shortest_path_through(distances)
+        current_length = distances[np.arange(len(path) - 1), np.arange(1, len(path))].sum()
+        if length > current_length - self.MIN_IMPROVEMENT:
+            return None
+        return ReorderMove(state, start, path[order])
+
+    def variables(self, state: TravelingSalesmanState) -> Iterable[int]:
+        return range(len(self.neighbours))
+
+    def moves_around(self, state: TravelingSalesmanState, point: int) -> Generator[ReorderMove, None, None]:
+        move = self.reoptimize(state, self.window_start(
+            state, int(state.positions[point])))
+        if move is not None:
+            yield move
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[ReorderMove, None, None]:
+        # window that is already visited in the best order is shuffled, so there is always a move to make
+        while True:
+            start = self.window_start(
+                state, random.randrange(1, len(state.route) - 1))
+            move = self.reoptimize(state, start)
+            if move is None:
+                window = state.route[start:start + self.window_size(state)].tolist()
+                move = ReorderMove(state, start, random.sample(window, len(window)))
+            yield move
+
+    def touched_variables(self, move: ReorderMove) -> Iterable[int]:
+        return {int(point) for edge in move.removed_edges() for point in edge}
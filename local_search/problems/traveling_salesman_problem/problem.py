@@ -1,46 +1,217 @@
+from dataclasses import asdict, dataclass
 from io import TextIOWrapper
-from typing import Iterable, List, Union
-import random
+from time import time
+from typing import Iterable, List, Tuple, Union
+import numpy as np
 from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.base.moves import Move
 from local_search.problems.base.problem import Problem, Goal
+from local_search.problems.traveling_salesman_problem.construction import GreedyEdge, TourConstruction
+from local_search.problems.traveling_salesman_problem.distance_metrics import DISTANCE_METRICS, EXPLICIT, \
+    PLANAR_METRICS
+from local_search.problems.traveling_salesman_problem.distance_oracle import DistanceOracle
 from local_search.problems.traveling_salesman_problem.goal import TravelingSalesmanGoal, Distance
+from local_search.problems.traveling_salesman_problem.lower_bound import held_karp_bound
 from local_search.problems.traveling_salesman_problem.models.point import \
     Point
 from local_search.problems.traveling_salesman_problem.models.salesman import \
     Salesman
 from local_search.problems.traveling_salesman_problem.moves.move_generator import \
     TravelingSalesmanMoveGenerator
+from local_search.problems.traveling_salesman_problem.moves.window_reoptimization import WindowReoptimization
+from local_search.problems.traveling_salesman_problem.spatial_index import \
+    GridIndex
 from local_search.problems.traveling_salesman_problem.state import \
-    TravelingSalesmanState
+    TravelingSalesmanState, TwoLevelListTravelingSalesmanState
+from local_search.problems.traveling_salesman_problem.tsplib import TSPLIB_EXTENSION, parse_tsplib
+
+
+# upper bound on the number of distances computed at once when looking for nearest neighbours
+NEIGHBOURS_BATCH_SIZE = 2 ** 22
+# upper bound on the number of distances computed at once when filling the distance matrix
+DISTANCES_BATCH_SIZE = 2 ** 22
+
+# states that keep the route in different data structures
+TOURS = {
+    'array': TravelingSalesmanState,
+    'two_level_list': TwoLevelListTravelingSalesmanState,
+}
+
+
+@dataclass
+class TravelingSalesmanProblemConfig:
+    n_neighbours: int = 10
+    tour: str = 'array'
+    construction: str = 'random'
+    # distances between more points are computed when they are needed instead of being kept in a matrix,
+    # the matrix takes 8 * n^2 bytes, 800 MB for 10000 points
+    max_matrix_points: int = 10000
+
+
+DEFAULT_CONFIG = TravelingSalesmanProblemConfig()
 
 
 class TravelingSalesmanProblem(Problem):
 
-    def __init__(self, points: List[Point],
+    def __init__(self, points: Union[List[Point], np.ndarray],
                  depot_idx: int,
                  move_generator_name: Union[str, None] = None,
-                 goal_name: Union[str, None] = "distance"):
-        self._points: List[Point] = points
+                 goal_name: Union[str, None] = "distance",
+                 config: TravelingSalesmanProblemConfig = None,
+                 distance_metric: str = "euclidean",
+                 distances: Union[np.ndarray, None] = None,
+                 has_coordinates: bool = True):
+        self.config = config or DEFAULT_CONFIG
+        if self.config.tour not in TOURS:
+            raise ValueError(
+                f'Unknown tour: {self.config.tour}. Available tours are: {", ".join(TOURS)}')
+        if self.config.construction not in TourConstruction.constructions:
+            raise ValueError(f'Unknown construction: {self.config.construction}. Available constructions are: '
+                             f'{", ".join(TourConstruction.constructions)}')
+        if not has_coordinates and TourConstruction.constructions[self.config.construction].USES_COORDINATES:
+            raise ValueError(f'Construction {self.config.construction} needs coordinates of the points, '
+                             'which the problem does not have')
+        # points of instances given only by distances have placeholder coordinates
+        self.has_coordinates = has_coordinates
+        if isinstance(points, np.ndarray):
+            self.coordinates: np.ndarray = points.astype(np.float64)
+            self._points: List[Point] = [Point(x, y)
+                                         for x, y in self.coordinates.tolist()]
+        else:
+            self._points: List[Point] = points
+            self.coordinates: np.ndarray = np.array(
+                [(point.x, point.y) for point in self._points], dtype=np.float64)
         self.depot_idx = depot_idx
+        self.distance_metric = distance_metric
+        self.distances: Union[np.ndarray, DistanceOracle] = self._create_distances() if distances is None \
+            else np.ascontiguousarray(distances, dtype=np.float64)
+        # grid over the points, used only when distances grow with the distance on the plane
+        self.spatial_index: Union[GridIndex, None] = GridIndex(self.coordinates) \
+            if self.distance_metric in PLANAR_METRICS else None
+        self.neighbours: np.ndarray = self._create_neighbours()
+        if isinstance(self.distances, DistanceOracle):
+            self.distances.remember_neighbours(self.neighbours)
+        self.construction = TourConstruction.constructions[self.config.construction](
+            self.coordinates, self.distances, self.neighbours, self.spatial_index)
+        self._objective_bound: Union[float, None] = None
         initial_solution = self.random_state()
         move_generator_name = move_generator_name or list(
             self.get_available_move_generation_strategies())[0]
         move_generator = TravelingSalesmanMoveGenerator.move_generators[move_generator_name](
-        )
+            self.distances, self.neighbours)
         goal_name = goal_name or list(self.get_available_goals())[0]
-        goal = TravelingSalesmanGoal.goals[goal_name](self._points)
+        goal = TravelingSalesmanGoal.goals[goal_name](
+            self._points, self.distances)
         super().__init__(initial_solution, move_generator, goal)
 
     @property
     def points(self):
         return self._points
 
+    def _create_distances(self) -> Union[np.ndarray, DistanceOracle]:
+        """
+        Calculates matrix of distances between every pair of points, or creates oracle that calculates them
+        when they are needed if the matrix would be too large.
+        """
+        if self.distance_metric == EXPLICIT:
+            raise ValueError(
+                'Distances have to be passed when the distance metric is explicit')
+        if len(self.coordinates) > self.config.max_matrix_points:
+            return DistanceOracle(self.coordinates, self.distance_metric)
+        n_points = len(self.coordinates)
+        metric = DISTANCE_METRICS[self.distance_metric]
+        distances = np.empty((n_points, n_points), dtype=np.float64)
+        # rows are filled in batches, so temporary arrays of the metric stay small next to the matrix
+        rows_in_batch = max(DISTANCES_BATCH_SIZE // max(n_points, 1), 1)
+        for first_row in range(0, n_points, rows_in_batch):
+            rows = slice(first_row, first_row + rows_in_batch)
+            distances[rows] = metric(
+                self.coordinates[rows, None, :], self.coordinates[None, :, :])
+        np.fill_diagonal(distances, 0)
+        return distances
+
+    def _create_neighbours(self) -> np.ndarray:
+        """
+        Finds nearest neighbours of every point, on the plane when the metric allows it.
+        """
+        if self.spatial_index is not None:
+            return self.spatial_index.k_nearest(self.config.n_neighbours)
+        n_points = len(self.distances)
+        k = min(self.config.n_neighbours, n_points - 1)
+        if k <= 0:
+            return np.empty((n_points, max(k, 0)), dtype=np.int32)
+        neighbours = np.empty((n_points, k), dtype=np.int32)
+        rows_in_batch = max(NEIGHBOURS_BATCH_SIZE // n_points, 1)
+        for first_row in range(0, n_points, rows_in_batch):
+            rows = np.arange(first_row, min(
+                first_row + rows_in_batch, n_points))
+            distances = np.array(
+                self.distances[np.ix_(rows, np.arange(n_points))], dtype=np.float64)
+            distances[np.arange(len(rows)), rows] = np.inf
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            by_distance = np.argsort(np.take_along_axis(
+                distances, nearest, axis=1), axis=1)
+            neighbours[rows] = np.take_along_axis(nearest, by_distance, axis=1)
+        return neighbours
+
     def random_state(self) -> TravelingSalesmanState:
-        route = [idx for idx in range(
-            len(self._points)) if idx != self.depot_idx]
-        random.shuffle(route)
-        naive_circle = [self.depot_idx] + route + [self.depot_idx]
-        return TravelingSalesmanState(points=self.points, route=naive_circle)
+        """
+        Builds route with the configured construction, starting and ending in the depot.
+        """
+        tour = self.construction.tour()
+        depot_position = int(np.flatnonzero(tour == self.depot_idx)[0])
+        route = np.concatenate(
+            (tour[depot_position:], tour[:depot_position + 1])).tolist()
+        return TOURS[self.config.tour](points=self.points, route=route)
+
+    def best_move(self, state: TravelingSalesmanState) -> Union[Tuple[Move[TravelingSalesmanState], float], None]:
+        if not isinstance(self.goal, Distance):
+            return None
+        best_move = self.move_generator.best_move(state)
+        if best_move is None:
+            return None
+        move, delta = best_move
+        return move, delta * self.goal.type().value
+
+    def objective_bound(self, time_limit: Union[float, None] = None) -> Union[float, None]:
+        """
+        Calculates Held-Karp lower bound on the distance, computed once and then remembered.
+        The bound needs the whole distance matrix, so it isn't calculated when distances are computed on demand.
+        """
+        if not isinstance(self.goal, Distance) or isinstance(self.distances, DistanceOracle):
+            return None
+        if self._objective_bound is None:
+            start_time = time()
+            tour = GreedyEdge(self.coordinates, self.distances,
+                              self.neighbours).tour()
+            upper_bound = self.distances[tour, np.roll(tour, -1)].sum()
+            self._objective_bound = held_karp_bound(
+                self.distances, upper_bound,
+                time_limit=None if time_limit is None else max(time_limit - (time() - start_time), 0))
+        return self._objective_bound
+
+    def intensify(self, state: TravelingSalesmanState) -> Union[TravelingSalesmanState, None]:
+        """
+        Visits points of every window of consecutive points of the route in the best order.
+        Windows overlap by half, and windows next to the improved one are checked again.
+        """
+        if not isinstance(self.goal, Distance):
+            return None
+        window = WindowReoptimization(self.distances, self.neighbours)
+        step = max(window.window_size(state) // 2, 1)
+        state = state.copy()
+        starts = [window.window_start(state, position)
+                  for position in range(1, len(state.route) - 1, step)]
+        to_check = np.ones(len(starts), dtype=bool)
+        while to_check.any():
+            for index in np.flatnonzero(to_check):
+                to_check[index] = False
+                move = window.reoptimize(state, starts[index])
+                if move is not None:
+                    move.apply()
+                    to_check[max(index - 1, 0):index + 2] = True
+                    to_check[index] = False
+        return state
 
     @staticmethod
     def get_available_move_generation_strategies() -> Iterable[str]:
@@ -51,14 +222,29 @@ class TravelingSalesmanProblem(Problem):
         return TravelingSalesmanGoal.goals.keys()
 
     @classmethod
-    def from_benchmark(cls, benchmark_name: str, move_generator_name: str = None, goal_name: str = "distance"):
-        with open(cls.get_path_to_benchmarks()/benchmark_name) as benchmark_file:
+    def from_benchmark(cls, benchmark_name: str, move_generator_name: str = None, goal_name: str = "distance",
+                       config: TravelingSalesmanProblemConfig = None):
+        benchmark_path = cls.get_path_to_benchmarks()/benchmark_name
+        with open(benchmark_path) as benchmark_file:
+            if benchmark_path.suffix == TSPLIB_EXTENSION:
+                instance = parse_tsplib(benchmark_file)
+                return cls(
+                    points=instance.coordinates,
+                    depot_idx=0,
+                    move_generator_name=move_generator_name,
+                    goal_name=goal_name,
+                    config=config,
+                    distance_metric=instance.distance_metric,
+                    distances=instance.distances,
+                    has_coordinates=instance.has_coordinates
+                )
             depot_idx, points = cls.parse_model(benchmark_file)
             return cls(
                 points=points,
                 depot_idx=depot_idx,
                 move_generator_name=move_generator_name,
-                goal_name=goal_name
+                goal_name=goal_name,
+                config=config
             )
 
     @classmethod
@@ -82,11 +268,26 @@ class TravelingSalesmanProblem(Problem):
         return {
             'depot_idx': self.depot_idx,
             'points': [(point.x, point.y) for point in self.points],
+            'config': asdict(self.config),
+            'distance_metric': self.distance_metric,
+            # distances that can be calculated from the points are not saved
+            'distances': self.distances.tolist() if self.distance_metric == EXPLICIT else None,
             **base
         }
 
+    @classmethod
+    def validate_data(cls, data):
+        # solutions saved before the problem became configurable have no config
+        data.setdefault('config', {})
+        data.setdefault('distance_metric', 'euclidean')
+        data.setdefault('distances', None)
+        super().validate_data(data)
+
     @classmethod
     def from_dict(cls, data):
         data['points'] = [Point(x=point_tuple[0], y=point_tuple[1])
                           for point_tuple in data['points']]
+        data['config'] = TravelingSalesmanProblemConfig(**data['config'])
+        if data['distances'] is not None:
+            data['distances'] = np.array(data['distances'], dtype=np.float64)
         return cls(**data)
@@ -0,0 +1,133 @@
+from math import sqrt
+from typing import Tuple
+
+import numpy as np
+
+
+class GridIndex:
+    """
+    Uniform grid laid over the points.
+
+    Allows answering nearest neighbour queries by looking only at the cells
+    around a point instead of comparing every pair of points.
+    """
+
+    def __init__(self, coordinates: np.ndarray, points_per_cell: int = 2):
+        self.coordinates = coordinates
+        self._origin = coordinates.min(axis=0)
+        extent = coordinates.max(axis=0) - self._origin
+        n_cells = max(1, len(coordinates) // points_per_cell)
+        self.cell_size = max(sqrt(extent[0] * extent[1] / n_cells),
+                             extent.max() / n_cells,
+                             1e-9)
+        self.shape: Tuple[int, int] = tuple(
+            (extent // self.cell_size).astype(int) + 1)
+        cells = self.cells_of(coordinates)
+        # cell of every point, indexed as column * rows + row
+        self.flat_cells = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self._order = np.argsort(self.flat_cells, kind='stable').astype(np.int32)
+        self._cell_starts = np.searchsorted(
+            self.flat_cells[self._order], np.arange(self.shape[0] * self.shape[1] + 1))
+
+    def cells_of(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Returns (column, row) of the grid cell for every passed point
+        """
+        cells = ((coordinates - self._origin) // self.cell_size).astype(int)
+        return np.clip(cells, 0, np.array(self.shape) - 1)
+
+    def points_in_window(self, column: int, row: int, radius: int) -> np.ndarray:
+        """
+        Returns indices of points that lay in cells at most `radius` cells away from the passed one
+        """
+        first_row = max(row - radius, 0)
+        last_row = min(row + radius, self.shape[1] - 1)
+        slices = []
+        for window_column in range(max(column - radius, 0), min(column + radius, self.shape[0] - 1) + 1):
+            start = self._cell_starts[window_column * self.shape[1] + first_row]
+            end = self._cell_starts[window_column * self.shape[1] + last_row + 1]
+            slices.append(self._order[start:end])
+        return np.concatenate(slices)
+
+    def points_per_cell(self) -> np.ndarray:
+        """
+        Returns number of points in every cell, indexed like `flat_cells`
+        """
+        return np.diff(self._cell_starts)
+
+    def _ring(self, column: int, row: int, radius: int) -> np.ndarray:
+        """
+        Returns cells exactly `radius` cells away from the passed one, indexed like `flat_cells`
+        """
+        if radius == 0:
+            return np.array([column * self.shape[1] + row])
+        columns = np.arange(column - radius, column + radius + 1)
+        rows = np.arange(row - radius + 1, row + radius)
+        ring_columns = np.concatenate((columns, columns,
+                                       np.full(len(rows), column - radius), np.full(len(rows), column + radius)))
+        ring_rows = np.concatenate((np.full(len(columns), row - radius), np.full(len(columns), row + radius),
+                                    rows, rows))
+        inside = (ring_columns >= 0) & (ring_columns < self.shape[0]) & (
+            ring_rows >= 0) & (ring_rows < self.shape[1])
+        return ring_columns[inside] * self.shape[1] + ring_rows[inside]
+
+    def nearest_remaining(self, point: int, remaining: np.ndarray, remaining_in_cells: np.ndarray) -> int:
+        """
+        Finds the nearest point among those marked in `remaining`, looking at rings of cells around the point.
+        :param remaining_in_cells: number of remaining points in every cell, cells without them are skipped
+        """
+        column, row = divmod(int(self.flat_cells[point]), self.shape[1])
+        nearest, nearest_distance = -1, np.inf
+        radius = 0
+        while True:
+            cells = self._ring(column, row, radius)
+            cells = cells[remaining_in_cells[cells] > 0]
+            if len(cells) > 0:
+                candidates = np.concatenate([self._order[self._cell_starts[cell]:self._cell_starts[cell + 1]]
+                                             for cell in cells.tolist()])
+                candidates = candidates[remaining[candidates]]
+                distances = np.hypot(
+                    *(self.coordinates[candidates] - self.coordinates[point]).T)
+                closest = int(np.argmin(distances))
+                if distances[closest] < nearest_distance:
+                    nearest, nearest_distance = int(candidates[closest]), distances[closest]
+            # points outside of the window are at least `radius` cells away from the point
+            if nearest_distance <= radius * self.cell_size or self.covers_grid(column, row, radius):
+                return nearest
+            radius += 1
+
+    def covers_grid(self, column: int, row: int, radius: int) -> bool:
+        return column - radius <= 0 and row - radius <= 0 \
+            and column + radius >= self.shape[0] - 1 and row + radius >= self.shape[1] - 1
+
+    def k_nearest(self, k: int) -> np.ndarray:
+        """
+        Finds k nearest neighbours of every point.
+        :returns: array of shape (n_points, k), neighbours of each point are sorted from the nearest one
+        """
+        n_points = len(self.coordinates)
+        k = min(k, n_points - 1)
+        neighbours = np.empty((n_points, max(k, 0)), dtype=np.int32)
+        if k <= 0:
+            return neighbours
+        for cell in np.flatnonzero(np.diff(self._cell_starts)):
+            queries = self._order[self._cell_starts[cell]:self._cell_starts[cell + 1]]
+            column, row = divmod(int(cell), self.shape[1])
+            radius = 1
+            while True:
+                candidates = self.points_in_window(column, row, radius)
+                if len(candidates) > k:
+                    distances = np.hypot(
+                        *(self.coordinates[queries, None, :] - self.coordinates[None, candidates, :]).transpose(2, 0, 1))
+                    distances[queries[:, None] == candidates[None, :]] = np.inf
+                    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+                    nearest_distances = np.take_along_axis(
+                        distances, nearest, axis=1)
+                    # points outside of the window are at least `radius` cells away from the query points
+                    if nearest_distances.max() <= radius * self.cell_size or self.covers_grid(column, row, radius):
+                        by_distance = np.argsort(nearest_distances, axis=1)
+                        neighbours[queries] = candidates[np.take_along_axis(
+                            nearest, by_distance, axis=1)]
+                        break
+                radius += 1
+        return neighbours
@@ -1,19 +1,150 @@
 
-from dataclasses import dataclass
-from typing import Iterable, List, Tuple
+import base64
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple, Union
 
+import numpy as np
 from local_search.problems.base.state import State
 from local_search.problems.traveling_salesman_problem.models.edge import \
     Edge
 from random import sample
 
 from local_search.problems.traveling_salesman_problem.models.point import Point
+from local_search.problems.traveling_salesman_problem.two_level_list import TwoLevelList
+from local_search.problems.traveling_salesman_problem.zobrist import route_hash
 
 
 @dataclass
 class TravelingSalesmanState(State):
-    route: List[int]
+    route: np.ndarray
     points: List[Point]
+    _positions: Union[np.ndarray, None] = field(
+        default=None, init=False, repr=False, compare=False)
+    _hash: Union[int, None] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.route = np.asarray(self.route, dtype=np.int32)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Index of every point in the route. The depot, which both starts and ends the route, has index 0.
+        Computed on first use and then kept up to date by `reverse` and `swap`.
+        """
+        if self._positions is None:
+            self._positions = np.empty(len(self.route) - 1, dtype=np.int32)
+            self._positions[self.route[:-1]] = np.arange(
+                len(self.route) - 1, dtype=np.int32)
+        return self._positions
+
+    @property
+    def tour_hash(self) -> int:
+        """
+        Zobrist hash of the set of edges of the route.
+        Computed on first use and then kept up to date by moves.
+        """
+        if self._hash is None:
+            self._hash = route_hash(self.route)
+        return self._hash
+
+    @property
+    def n_points(self) -> int:
+        """
+        Number of points, the route has one more index as it comes back to the depot
+        """
+        return len(self.route) - 1
+
+    def point_at(self, index: int) -> int:
+        """
+        Returns point at the index of the route
+        """
+        return int(self.route[index])
+
+    def next(self, point: int) -> int:
+        """
+        Returns point visited right after the passed one
+        """
+        return int(self.route[self.positions[point] + 1])
+
+    def prev(self, point: int) -> int:
+        """
+        Returns point visited right before the passed one
+        """
+        # the depot precedes the closing copy of itself at the end of the route
+        return int(self.route[(self.positions[point] or len(self.route) - 1) - 1])
+
+    def between(self, a: int, b: int, c: int) -> bool:
+        """
+        Checks if b lays on the path that goes from a to c
+        """
+        a, b, c = self.positions[a], self.positions[b], self.positions[c]
+        if a <= c:
+            return a <= b <= c
+        return b >= a or b <= c
+
+    def reverse_path(self, first: int, last: int):
+        """
+        Reverses path that goes from first to last in place.
+        The rest of the route may be reversed instead, which gives the same edges but changes direction of the route.
+        """
+        start, end = self.positions[first], self.positions[last]
+        if start == end:
+            return
+        if 0 < start <= end:
+            self.reverse(start, end + 1)
+        else:
+            # the depot can't be moved
+            self.reverse(end + 1, start or len(self.route) - 1)
+
+    def reverse(self, start: int, end: int):
+        """
+        Reverses route[start:end] in place
+        """
+        self.route[start:end] = self.route[start:end][::-1]
+        if self._positions is not None:
+            self._positions[self.route[start:end]] = np.arange(
+                start, end, dtype=np.int32)
+
+    def move_segment(self, start: int, end: int, after: int, reverse: bool = False):
+        """
+        Moves route[start:end] in place, so it follows the point that is at index `after` now.
+        Optionally reverses the moved segment.
+        """
+        length = end - start
+        segment = self.route[start:end].copy()
+        if reverse:
+            segment = segment[::-1]
+        if after >= end:
+            self.route[start:after - length + 1] = self.route[end:after + 1]
+            self.route[after - length + 1:after + 1] = segment
+            changed_start, changed_end = start, after + 1
+        else:
+            self.route[after + 1 + length:end] = self.route[after + 1:start]
+            self.route[after + 1:after + 1 + length] = segment
+            changed_start, changed_end = after + 1, end
+        if self._positions is not None:
+            self._positions[self.route[changed_start:changed_end]] = np.arange(
+                changed_start, changed_end, dtype=np.int32)
+
+    def reorder(self, start: int, points: np.ndarray):
+        """
+        Replaces route[start:start + len(points)] in place with the passed points, which are the same points in another order
+        """
+        end = start + len(points)
+        self.route[start:end] = points
+        if self._positions is not None:
+            self._positions[self.route[start:end]] = np.arange(
+                start, end, dtype=np.int32)
+
+    def swap(self, i1: int, i2: int):
+        """
+        Swaps points at indices i1 and i2 of the route in place
+        """
+        self.route[i1], self.route[i2] = self.route[i2], self.route[i1]
+        if self._positions is not None:
+            self._positions[self.route[i1]] = i1
+            self._positions[self.route[i2]] = i2
 
     def __str__(self):
         return str.join(" -> ", map(lambda idx: f'({self.points[idx].x}, {self.points[idx].y})', self.route))
@@ -21,28 +152,183 @@ class TravelingSalesmanState(State):
     @property
     def edges(self) -> Iterable[Edge]:
         not_connected_edges = zip(
-            self.route,
-            self.route[1:] + [self.route[0]]
+            self.route.tolist(),
+            np.roll(self.route, -1).tolist()
         )
         return map(lambda edge: Edge(edge[0], edge[1]), not_connected_edges)
 
+    def copy(self) -> 'TravelingSalesmanState':
+        new_state = TravelingSalesmanState(self.route.copy(), self.points)
+        if self._positions is not None:
+            new_state._positions = self._positions.copy()
+        new_state._hash = self._hash
+        return new_state
+
     def __eq__(self, other):
         if other is None:
             return False
-        is_any_idx_differs = any(
-            self.route[i] != other.route[i] for i in range(len(self.route)))
-        return not is_any_idx_differs
+        if self is other:
+            return True
+        # routes with different edges can't be equal, so most of them are told apart without comparing points
+        if self.tour_hash != other.tour_hash:
+            return False
+        return np.array_equal(self.route, other.route)
+
+    def __hash__(self):
+        return self.tour_hash
 
     def asdict(self):
         base = super().asdict()
+        # points are saved by the problem, so only the route is saved, packed into base64 encoded int32 array
         return {
-            'route': self.route,
-            'points': [(point.x, point.y) for point in self.points],
+            'route': base64.b64encode(self.route.astype('<i4').tobytes()).decode('ascii'),
             **base
         }
 
     @classmethod
-    def from_dict(cls, data):
-        data['points'] = [Point(x=point_tuple[0], y=point_tuple[1])
-                          for point_tuple in data['points']]
+    def validate_data(cls, data):
+        # states saved before routes were packed contain their points
+        data.setdefault('points', None)
+        super().validate_data(data)
+
+    @classmethod
+    def from_dict(cls, data, problem=None):
+        if isinstance(data['route'], str):
+            data['route'] = np.frombuffer(
+                base64.b64decode(data['route']), dtype='<i4').astype(np.int32)
+        if data['points'] is None:
+            if problem is None:
+                raise ValueError(
+                    'Problem is needed to create state that has no points')
+            data['points'] = problem.points
+        else:
+            data['points'] = [Point(x=point_tuple[0], y=point_tuple[1])
+                              for point_tuple in data['points']]
         return cls(**data)
+
+
+class _TwoLevelListPositions:
+    """
+    Index of every point in the route, read from the two-level list without building the route
+    """
+
+    def __init__(self, state: 'TwoLevelListTravelingSalesmanState'):
+        self._state = state
+
+    def __getitem__(self, point: int) -> int:
+        return self._state._index_of(int(point))
+
+
+class TwoLevelListTravelingSalesmanState(TravelingSalesmanState):
+    """
+    State that keeps the route in a two-level list, which reverses paths in O(sqrt(n)).
+
+    Index based operations find points by their indices in the list and are made of path reversals,
+    so the route is built from the list only when it is read as a whole.
+    """
+
+    def __init__(self, route: np.ndarray, points: List[Point]):
+        self._tour: TwoLevelList = None
+        self._depot: int = 0
+        # index of the depot in the list, forgotten when the list changes
+        self._depot_position: Union[int, None] = None
+        self._route: Union[np.ndarray, None] = None
+        super().__init__(route, points)
+
+    def __post_init__(self):
+        # the route setter already built the list from the route
+        pass
+
+    @property
+    def route(self) -> np.ndarray:
+        if self._route is None:
+            tour = self._tour.tour()
+            depot_index = int(np.flatnonzero(tour == self._depot)[0])
+            self._route = np.concatenate(
+                (tour[depot_index:], tour[:depot_index + 1]))
+        return self._route
+
+    @route.setter
+    def route(self, route: np.ndarray):
+        route = np.asarray(route, dtype=np.int32)
+        self._tour = TwoLevelList(route[:-1])
+        self._depot = int(route[0])
+        self._depot_position = None
+        self._route = route
+        self._hash = None
+
+    @property
+    def positions(self) -> _TwoLevelListPositions:
+        return _TwoLevelListPositions(self)
+
+    @property
+    def n_points(self) -> int:
+        return len(self._tour)
+
+    def _start(self) -> int:
+        if self._depot_position is None:
+            self._depot_position = self._tour.position(self._depot)
+        return self._depot_position
+
+    def _index_of(self, point: int) -> int:
+        return (self._tour.position(point) - self._start()) % len(self._tour)
+
+    def point_at(self, index: int) -> int:
+        return self._tour.point_at((self._start() + index) % len(self._tour))
+
+    def next(self, point: int) -> int:
+        return self._tour.next(point)
+
+    def prev(self, point: int) -> int:
+        return self._tour.prev(point)
+
+    def between(self, a: int, b: int, c: int) -> bool:
+        return self._tour.between(a, b, c)
+
+    def reverse_path(self, first: int, last: int):
+        self._tour.reverse_path(first, last)
+        self._depot_position = None
+        self._route = None
+
+    def reverse(self, start: int, end: int):
+        if end - start > 1:
+            self.reverse_path(self.point_at(start), self.point_at(end - 1))
+
+    def move_segment(self, start: int, end: int, after: int, reverse: bool = False):
+        # moving segment in front of the points that follow it is the same as reversing the segment,
+        # the points and then all of them together
+        if after >= end:
+            if not reverse:
+                self.reverse(start, end)
+            self.reverse(end, after + 1)
+            self.reverse(start, after + 1)
+        else:
+            if not reverse:
+                self.reverse(start, end)
+            self.reverse(after + 1, start)
+            self.reverse(after + 1, end)
+
+    def reorder(self, start: int, points: np.ndarray):
+        # every point is brought to its place by reversing the path between the place and the point
+        for index, point in enumerate(points, start):
+            position = self._index_of(int(point))
+            if position != index:
+                self.reverse(index, position + 1)
+
+    def swap(self, i1: int, i2: int):
+        i1, i2 = sorted((i1, i2))
+        self.reverse(i1, i2 + 1)
+        self.reverse(i1 + 1, i2)
+
+    def copy(self) -> 'TwoLevelListTravelingSalesmanState':
+        new_state = TwoLevelListTravelingSalesmanState.__new__(
+            TwoLevelListTravelingSalesmanState)
+        new_state.points = self.points
+        new_state._tour = self._tour.copy()
+        new_state._depot = self._depot
+        new_state._depot_position = self._depot_position
+        # the route is shared until one of the states changes, as changes replace it instead of modifying it
+        new_state._route = self._route
+        new_state._positions = None
+        new_state._hash = self._hash
+        return new_state
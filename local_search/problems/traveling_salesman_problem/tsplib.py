@@ -0,0 +1,102 @@
+import re
+from dataclasses import dataclass
+from io import TextIOWrapper
+from typing import Dict, Union
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.distance_metrics import DISTANCE_METRICS, EXPLICIT
+
+TSPLIB_EXTENSION = '.tsp'
+
+_SECTION = re.compile(r'^\s*([A-Z_]+_SECTION|EOF)\s*:?\s*$', re.MULTILINE)
+
+# indices of the matrix cells filled by the consecutive weights, matrix is symmetric so *_COL formats
+# list the same cells as the opposite *_ROW ones
+_TRIANGLES = {
+    'UPPER_ROW': lambda n: np.triu_indices(n, 1),
+    'LOWER_ROW': lambda n: np.tril_indices(n, -1),
+    'UPPER_DIAG_ROW': lambda n: np.triu_indices(n),
+    'LOWER_DIAG_ROW': lambda n: np.tril_indices(n),
+    'UPPER_COL': lambda n: np.tril_indices(n, -1),
+    'LOWER_COL': lambda n: np.triu_indices(n, 1),
+    'UPPER_DIAG_COL': lambda n: np.tril_indices(n),
+    'LOWER_DIAG_COL': lambda n: np.triu_indices(n),
+}
+
+
+@dataclass
+class TSPLibInstance:
+    name: str
+    coordinates: np.ndarray
+    distance_metric: str
+    distances: Union[np.ndarray, None] = None
+    # explicit instances may have no coordinates, then points are placed on a circle only to be drawn
+    has_coordinates: bool = True
+
+
+def _numbers(section: str) -> np.ndarray:
+    return np.array(section.split(), dtype=np.float64)
+
+
+def _coordinates(section: str, dimension: int) -> np.ndarray:
+    nodes = _numbers(section).reshape(-1, 3)
+    coordinates = np.empty((dimension, 2), dtype=np.float64)
+    # nodes are numbered from 1
+    coordinates[nodes[:, 0].astype(np.int64) - 1] = nodes[:, 1:]
+    return coordinates
+
+
+def _circle(dimension: int) -> np.ndarray:
+    angles = np.linspace(0, 2 * np.pi, dimension, endpoint=False)
+    return np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+def _edge_weights(section: str, dimension: int, edge_weight_format: str) -> np.ndarray:
+    weights = _numbers(section)
+    if edge_weight_format == 'FULL_MATRIX':
+        return np.ascontiguousarray(weights.reshape(dimension, dimension))
+    if edge_weight_format not in _TRIANGLES:
+        raise ValueError(
+            f'Unsupported EDGE_WEIGHT_FORMAT: {edge_weight_format}')
+    rows, columns = _TRIANGLES[edge_weight_format](dimension)
+    distances = np.zeros((dimension, dimension), dtype=np.float64)
+    distances[rows, columns] = weights
+    distances[columns, rows] = weights
+    return distances
+
+
+def parse_tsplib(file_buffer: TextIOWrapper) -> TSPLibInstance:
+    """
+    Reads symmetric TSP instance written in TSPLIB format.
+    Coordinates are used for drawing the route when distances are given explicitly,
+    and are made up when such instance has none.
+    """
+    parts = _SECTION.split(file_buffer.read())
+    specification: Dict[str, str] = {}
+    for line in parts[0].splitlines():
+        key, _, value = line.partition(':')
+        if value:
+            specification[key.strip().upper()] = value.strip()
+    sections = dict(zip(parts[1::2], parts[2::2]))
+
+    dimension = int(specification['DIMENSION'])
+    edge_weight_type = specification.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+    coordinates_section = sections.get(
+        'NODE_COORD_SECTION', sections.get('DISPLAY_DATA_SECTION'))
+    if coordinates_section is None and edge_weight_type != 'EXPLICIT':
+        raise ValueError(
+            f'TSPLIB instance {specification.get("NAME")} has no coordinates of the points')
+    coordinates = _circle(dimension) if coordinates_section is None \
+        else _coordinates(coordinates_section, dimension)
+
+    if edge_weight_type == 'EXPLICIT':
+        distances = _edge_weights(sections['EDGE_WEIGHT_SECTION'], dimension,
+                                  specification.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX'))
+        return TSPLibInstance(specification.get('NAME', ''), coordinates, EXPLICIT, distances,
+                              has_coordinates=coordinates_section is not None)
+    distance_metric = edge_weight_type.lower()
+    if distance_metric not in DISTANCE_METRICS:
+        raise ValueError(
+            f'Unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}')
+    return TSPLibInstance(specification.get('NAME', ''), coordinates, distance_metric)
@@ -0,0 +1,249 @@
+from bisect import bisect_right
+from math import isqrt
+from typing import List, Tuple, Union
+
+import numpy as np
+
+
+class TwoLevelList:
+    """
+    Tour split into about sqrt(n) segments kept in a list.
+
+    Every segment remembers whether its points should be read backwards, so a path is reversed
+    by reversing the order of the segments it spans and flipping their directions,
+    which takes O(sqrt(n)) operations instead of O(n).
+    """
+
+    def __init__(self, tour: np.ndarray):
+        self._build(np.asarray(tour, dtype=np.int32))
+
+    def _build(self, tour: np.ndarray):
+        n_points = len(tour)
+        self._segment_size = max(isqrt(n_points), 1)
+        self._segments: List[np.ndarray] = [tour[start:start + self._segment_size].copy()
+                                            for start in range(0, n_points, self._segment_size)]
+        self._n_segments = len(self._segments)
+        self._segment_of = np.empty(n_points, dtype=np.int32)
+        self._segment_of[tour] = np.arange(
+            n_points, dtype=np.int32) // self._segment_size
+        self._offset = np.empty(n_points, dtype=np.int32)
+        self._offset[tour] = np.arange(
+            n_points, dtype=np.int32) % self._segment_size
+        # reversing a path splits at most two segments and the list is rebuilt when there are too many of them,
+        # so arrays of segments have room for all of them
+        capacity = self._max_segments() + 3
+        # direction of every segment, segments in the tour order and place of every segment in that order
+        self._reversed = np.zeros(capacity, dtype=bool)
+        self._order = np.arange(capacity, dtype=np.int32)
+        self._rank = np.arange(capacity, dtype=np.int32)
+        self._lengths = np.zeros(capacity, dtype=np.int64)
+        self._lengths[:self._n_segments] = [len(segment) for segment in self._segments]
+        # segments that may be shared with copies of the list are copied before their points are changed
+        self._owned = np.ones(capacity, dtype=bool)
+        # index of the first point of the segment at every place, computed when it is needed
+        self._starts: Union[List[int], None] = None
+        # the whole tour is read backwards
+        self._flipped = False
+
+    def _max_segments(self) -> int:
+        return 2 * (len(self) // self._segment_size + 1)
+
+    def __len__(self) -> int:
+        return len(self._segment_of)
+
+    def copy(self) -> 'TwoLevelList':
+        new_list = TwoLevelList.__new__(TwoLevelList)
+        new_list._segment_size = self._segment_size
+        new_list._segments = list(self._segments)
+        new_list._n_segments = self._n_segments
+        new_list._reversed = self._reversed.copy()
+        new_list._order = self._order.copy()
+        new_list._rank = self._rank.copy()
+        new_list._lengths = self._lengths.copy()
+        self._owned[:] = False
+        new_list._owned = self._owned.copy()
+        new_list._segment_of = self._segment_of.copy()
+        new_list._offset = self._offset.copy()
+        new_list._starts = self._starts
+        new_list._flipped = self._flipped
+        return new_list
+
+    def tour(self) -> np.ndarray:
+        """
+        Returns points in the order they are visited
+        """
+        tour = np.concatenate([self._segments[segment][::-1] if self._reversed[segment] else self._segments[segment]
+                               for segment in self._order[:self._n_segments]])
+        return tour[::-1].copy() if self._flipped else tour
+
+    def _locate(self, point: int) -> Tuple[int, int]:
+        """
+        :returns: segment of the point and its index when the segment is read in its direction
+        """
+        segment = int(self._segment_of[point])
+        offset = int(self._offset[point])
+        if self._reversed[segment]:
+            return segment, len(self._segments[segment]) - 1 - offset
+        return segment, offset
+
+    def _point_at(self, segment: int, index: int) -> int:
+        points = self._segments[segment]
+        if self._reversed[segment]:
+            return int(points[len(points) - 1 - index])
+        return int(points[index])
+
+    def _successor(self, point: int) -> int:
+        segment, index = self._locate(point)
+        if index + 1 < len(self._segments[segment]):
+            return self._point_at(segment, index + 1)
+        return self._point_at(int(self._order[(self._rank[segment] + 1) % self._n_segments]), 0)
+
+    def _predecessor(self, point: int) -> int:
+        segment, index = self._locate(point)
+        if index > 0:
+            return self._point_at(segment, index - 1)
+        previous_segment = int(self._order[(self._rank[segment] - 1) % self._n_segments])
+        return self._point_at(previous_segment, len(self._segments[previous_segment]) - 1)
+
+    def next(self, point: int) -> int:
+        return self._predecessor(point) if self._flipped else self._successor(point)
+
+    def prev(self, point: int) -> int:
+        return self._successor(point) if self._flipped else self._predecessor(point)
+
+    def between(self, a: int, b: int, c: int) -> bool:
+        """
+        Checks if b lays on the path that goes from a to c in the tour direction
+        """
+        if self._flipped:
+            a, c = c, a
+        (segment_a, index_a), (segment_b, index_b), (segment_c, index_c) = map(
+            self._locate, (a, b, c))
+        a, b, c = ((self._rank[segment_a], index_a), (self._rank[segment_b], index_b),
+                   (self._rank[segment_c], index_c))
+        if a <= c:
+            return a <= b <= c
+        return b >= a or b <= c
+
+    def _segment_starts(self) -> List[int]:
+        """
+        :returns: index of the first point of the segment at every place, when the tour isn't flipped
+        """
+        if self._starts is None:
+            starts = np.zeros(self._n_segments, dtype=np.int64)
+            np.cumsum(self._lengths[self._order[:self._n_segments - 1]], out=starts[1:])
+            # single items are read faster from a list
+            self._starts = starts.tolist()
+        return self._starts
+
+    def position(self, point: int) -> int:
+        """
+        Returns index of the point in the tour returned by `tour`
+        """
+        segment, index = self._locate(point)
+        position = self._segment_starts()[self._rank[segment]] + index
+        return len(self) - 1 - position if self._flipped else position
+
+    def point_at(self, position: int) -> int:
+        """
+        Returns point at the index of the tour returned by `tour`
+        """
+        if self._flipped:
+            position = len(self) - 1 - position
+        starts = self._segment_starts()
+        rank = bisect_right(starts, position) - 1
+        return self._point_at(int(self._order[rank]), position - starts[rank])
+
+    def _reverse_within(self, segment: int, first: int, last: int):
+        """
+        Reverses points of the segment between indices first and last read in the segment direction
+        """
+        if not self._owned[segment]:
+            self._segments[segment] = self._segments[segment].copy()
+            self._owned[segment] = True
+        points = self._segments[segment]
+        if self._reversed[segment]:
+            first, last = len(points) - 1 - last, len(points) - 1 - first
+        points[first:last + 1] = points[first:last + 1][::-1]
+        self._offset[points[first:last + 1]] = np.arange(
+            first, last + 1, dtype=np.int32)
+
+    def _reverse_segments(self, first_rank: int, n_segments: int):
+        """
+        Reverses order and directions of n_segments segments that follow each other starting from first_rank
+        """
+        ranks = (first_rank + np.arange(n_segments)) % self._n_segments
+        segments = self._order[ranks]
+        self._order[ranks] = segments[::-1]
+        self._rank[segments[::-1]] = ranks
+        self._reversed[segments] = ~self._reversed[segments]
+        self._starts = None
+
+    def _split_before(self, point: int):
+        """
+        Splits segment of the point so that the point starts a segment
+        """
+        segment, index = self._locate(point)
+        if index == 0:
+            return
+        was_reversed = bool(self._reversed[segment])
+        points = self._segments[segment]
+        if was_reversed:
+            points = points[::-1]
+        head, tail = points[:index].copy(), points[index:].copy()
+        new_segment = self._n_segments
+        self._segments[segment] = head
+        self._segments.append(tail)
+        self._reversed[segment] = self._reversed[new_segment] = False
+        self._owned[segment] = self._owned[new_segment] = True
+        self._lengths[segment], self._lengths[new_segment] = len(head), len(tail)
+        # points of the head keep their offsets unless the segment was read backwards
+        if was_reversed:
+            self._offset[head] = np.arange(len(head), dtype=np.int32)
+        self._offset[tail] = np.arange(len(tail), dtype=np.int32)
+        self._segment_of[tail] = new_segment
+        following_rank = int(self._rank[segment]) + 1
+        self._order[following_rank + 1:new_segment + 1] = self._order[following_rank:new_segment]
+        self._order[following_rank] = new_segment
+        self._n_segments += 1
+        self._rank[self._order[following_rank:self._n_segments]] = np.arange(
+            following_rank, self._n_segments, dtype=np.int32)
+        self._starts = None
+
+    def reverse_path(self, first: int, last: int):
+        """
+        Reverses path that goes from first to last in the tour direction, so that
+        the point that preceded first precedes last afterwards
+        """
+        if self._flipped:
+            first, last = last, first
+        if first == last:
+            return
+        first_segment, first_index = self._locate(first)
+        last_segment, last_index = self._locate(last)
+        if first_segment == last_segment and first_index < last_index:
+            self._reverse_within(first_segment, first_index, last_index)
+            return
+        # reversing the rest of the tour and then direction of the whole tour gives the same result
+        if first_segment == last_segment:
+            if last_index + 1 < first_index:
+                self._reverse_within(
+                    first_segment, last_index + 1, first_index - 1)
+            self._flipped = not self._flipped
+            return
+        self._split_before(first)
+        following = self._successor(last)
+        if self._segment_of[following] == self._segment_of[last]:
+            self._split_before(following)
+        first_rank = int(self._rank[self._segment_of[first]])
+        last_rank = int(self._rank[self._segment_of[last]])
+        n_segments = (last_rank - first_rank) % self._n_segments + 1
+        if 2 * n_segments <= self._n_segments:
+            self._reverse_segments(first_rank, n_segments)
+        else:
+            self._reverse_segments(
+                (last_rank + 1) % self._n_segments, self._n_segments - n_segments)
+            self._flipped = not self._flipped
+        # splitting adds segments, so the list is rebuilt when there are too many of them
+        if self._n_segments > self._max_segments():
+            self._build(self.tour())
@@ -0,0 +1,51 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def _subsets_by_size(n_items: int) -> List[np.ndarray]:
+    """
+    Groups bitmasks of all subsets of n_items items by the number of items in them
+    """
+    masks = np.arange(1 << n_items, dtype=np.int64)
+    sizes = np.zeros(len(masks), dtype=np.int64)
+    for item in range(n_items):
+        sizes += (masks >> item) & 1
+    return [masks[sizes == size] for size in range(n_items + 1)]
+
+
+def shortest_path_through(distances: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Finds the shortest path that starts at the first point, visits all inner points and ends at the last point,
+    with Held-Karp dynamic programming over subsets of the inner points.
+
+    Cost of a subset and its point is the length of the shortest path that starts at the first point,
+    visits all points of the subset and ends at that point. All subsets of the same size are computed at once.
+    :param distances: distances between the points, the first and the last row belong to the fixed ends of the path
+    :returns: order of the inner points, as indices of the rows of distances, and length of the path
+    """
+    n_inner = len(distances) - 2
+    if n_inner <= 1:
+        return np.arange(1, n_inner + 1), float(distances[np.arange(n_inner + 1), np.arange(1, n_inner + 2)].sum())
+    inner = distances[1:-1, 1:-1]
+    bits = 1 << np.arange(n_inner, dtype=np.int64)
+    costs = np.full((1 << n_inner, n_inner), np.inf)
+    parents = np.zeros((1 << n_inner, n_inner), dtype=np.int8)
+    costs[bits, np.arange(n_inner)] = distances[0, 1:-1]
+    for masks in _subsets_by_size(n_inner)[2:]:
+        # for point outside of the mask the previous subset is larger and has no costs yet, so the point stays unreachable
+        candidates = costs[masks[:, None] ^ bits[None, :]] + inner.T[None, :, :]
+        best = np.argmin(candidates, axis=2)
+        parents[masks] = best
+        costs[masks] = np.take_along_axis(
+            candidates, best[:, :, None], axis=2)[:, :, 0]
+    all_points = (1 << n_inner) - 1
+    lengths = costs[all_points] + distances[1:-1, -1]
+    last = int(np.argmin(lengths))
+    order, mask = [], all_points
+    while mask:
+        order.append(last)
+        mask, last = mask ^ (1 << last), int(parents[mask, last])
+    return np.array(order[::-1]) + 1, float(lengths.min())
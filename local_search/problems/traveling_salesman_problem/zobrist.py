@@ -0,0 +1,46 @@
+from typing import Iterable, Tuple
+
+import numpy as np
+
+_MASK = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+_FIRST_MULTIPLIER = 0xBF58476D1CE4E5B9
+_SECOND_MULTIPLIER = 0x94D049BB133111EB
+
+
+def _edge_key(a: int, b: int) -> int:
+    a, b = int(a), int(b)
+    return (min(a, b) << 32) | max(a, b)
+
+
+def edge_hash(a: int, b: int) -> int:
+    """
+    Returns pseudorandom 64-bit number assigned to undirected edge (a, b), computed with splitmix64
+    """
+    z = (_edge_key(a, b) + _GOLDEN_GAMMA) & _MASK
+    z = ((z ^ (z >> 30)) * _FIRST_MULTIPLIER) & _MASK
+    z = ((z ^ (z >> 27)) * _SECOND_MULTIPLIER) & _MASK
+    return z ^ (z >> 31)
+
+
+def edges_hash(edges: Iterable[Tuple[int, int]]) -> int:
+    """
+    Returns xor of hashes of the edges
+    """
+    result = 0
+    for a, b in edges:
+        result ^= edge_hash(a, b)
+    return result
+
+
+def route_hash(route: np.ndarray) -> int:
+    """
+    Returns xor of hashes of all edges of the route, which doesn't depend on its direction nor starting point
+    """
+    starts, ends = route[:-1].astype(np.uint64), route[1:].astype(np.uint64)
+    keys = (np.minimum(starts, ends) << np.uint64(32)) | np.maximum(starts, ends)
+    with np.errstate(over='ignore'):
+        z = keys + np.uint64(_GOLDEN_GAMMA)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(_FIRST_MULTIPLIER)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(_SECOND_MULTIPLIER)
+    return int(np.bitwise_xor.reduce(z ^ (z >> np.uint64(31)), initial=np.uint64(0)))
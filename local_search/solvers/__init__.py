@@ -1 +1,3 @@
 from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.cluster_decomposition_solver import ClusterDecompositionSolver
+from local_search.solvers.partition_crossover_solver import PartitionCrossoverSolver
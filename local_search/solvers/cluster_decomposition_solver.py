@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from typing import Tuple, Type
+
+import numpy as np
+from local_search.algorithm_subscribers.algorithm_monitor import AlgorithmStatistics
+from local_search.algorithms.algorithm_config import AlgorithmConfig
+from local_search.algorithms.subscribable_algorithm import SubscribableAlgorithm
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.base import Problem
+from local_search.problems.traveling_salesman_problem.decomposition import CLUSTERINGS, cluster_arguments, \
+    order_clusters, polish, stitch
+from local_search.problems.traveling_salesman_problem.problem import TOURS, TravelingSalesmanProblem
+from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.solution import Solution
+from local_search.solvers.solver import Solver
+from local_search.solvers.solver_config import SolverConfig
+
+# part of the time limit spent on solving the clusters, the rest is left for polishing the joined route
+CLUSTERS_TIME_SHARE = 0.8
+# smaller clusters are visited in any order
+MIN_CLUSTER_SIZE = 5
+
+
+def _solve_cluster(coordinates: np.ndarray, problem_arguments: dict, algorithm_type: Type[SubscribableAlgorithm],
+                   algorithm_config: AlgorithmConfig, time_limit: float) -> Tuple[np.ndarray, AlgorithmStatistics]:
+    """
+    Solves problem made of points of one cluster, runs in a worker process
+    :returns: cycle through the points and statistics of the algorithm
+    """
+    problem = TravelingSalesmanProblem(coordinates, 0, **problem_arguments)
+    algorithm = algorithm_type(algorithm_config)
+    solution = LocalSearchSolver(SolverConfig(time_limit=time_limit)).solve(
+        problem, algorithm)
+    # when the time runs out, the solution has the current state, which may be worse than the best one
+    best_state = solution.state if algorithm.best_state is None else algorithm.best_state
+    return best_state.route[:-1], solution.statistics
+
+
+class ClusterDecompositionSolver(Solver):
+    """
+    Solver for traveling salesman problems too large for a single algorithm.
+
+    Splits points into spatial clusters and solves each of them with the algorithm in a separate process.
+    Cycles through the clusters are joined into one route, which is then improved with 2-opt restricted
+    to nearest neighbours, starting from the points where the cycles were joined.
+    """
+
+    def __init__(self, config: SolverConfig = None):
+        super().__init__(config)
+        if self._config.clustering not in CLUSTERINGS:
+            raise ValueError(
+                f'Unknown clustering: {self._config.clustering}. Available clusterings are: {", ".join(CLUSTERINGS)}')
+
+    def solve(self, model: Problem, algorithm: SubscribableAlgorithm) -> Solution:
+        if not isinstance(model, TravelingSalesmanProblem):
+            raise ValueError(
+                f'{type(self).__name__} solves only {TravelingSalesmanProblem.__name__}')
+        if not model.has_coordinates:
+            raise ValueError(
+                f'{type(self).__name__} clusters points by their coordinates, which the problem does not have')
+        self.start_timer()
+        labels = CLUSTERINGS[self._config.clustering](
+            model.coordinates, self._config.clusters)
+        clusters = [np.flatnonzero(labels == cluster)
+                    for cluster in range(labels.max() + 1)]
+        solved = [members for members in clusters if len(
+            members) >= MIN_CLUSTER_SIZE]
+        n_workers = max(min(os.cpu_count() or 1, len(solved)), 1)
+        cluster_time_limit = CLUSTERS_TIME_SHARE * \
+            self._time_limit / max(ceil(len(solved) / n_workers), 1)
+        problem_arguments = {
+            'move_generator_name': camel_to_snake(type(model.move_generator).__name__),
+            'goal_name': camel_to_snake(type(model.goal).__name__),
+            'config': model.config
+        }
+        with ProcessPoolExecutor(n_workers) as executor:
+            results = executor.map(_solve_cluster,
+                                   [model.coordinates[members] for members in solved],
+                                   [{**problem_arguments, **cluster_arguments(model.distance_metric,
+                                                                              model.distances, members)}
+                                    for members in solved],
+                                   [type(algorithm)] * len(solved),
+                                   [algorithm.config] * len(solved),
+                                   [cluster_time_limit] * len(solved))
+            cycles, statistics = [], []
+            for members, (cycle, cluster_statistics) in zip(solved, results):
+                cycles.append(members[cycle])
+                statistics.append(cluster_statistics)
+        cycles += [members for members in clusters if len(members)
+                   < MIN_CLUSTER_SIZE]
+
+        centroids = np.array([model.coordinates[cycle].mean(axis=0)
+                             for cycle in cycles])
+        first = next(index for index, cycle in enumerate(cycles)
+                     if model.depot_idx in cycle)
+        cycle = stitch(model.distances, model.coordinates, cycles,
+                       order_clusters(centroids, first))
+        depot_position = int(np.flatnonzero(cycle == model.depot_idx)[0])
+        route = np.concatenate(
+            (cycle[depot_position:], cycle[:depot_position + 1]))
+        state = TOURS[model.config.tour](points=model.points, route=route)
+        cycle_labels = np.empty(len(labels), dtype=np.int64)
+        for index, cycle in enumerate(cycles):
+            cycle_labels[cycle] = index
+        joins = np.flatnonzero(
+            cycle_labels[route[:-1]] != cycle_labels[route[1:]])
+        boundary = np.unique(np.concatenate(
+            (route[joins], route[joins + 1]))).tolist()
+        polish(model, state, boundary, self.start_time + self._time_limit)
+        self.stop_timer()
+
+        return Solution(
+            state=state,
+            problem=model,
+            statistics=AlgorithmStatistics(
+                algorithm_name=camel_to_snake(type(algorithm).__name__),
+                local_optimum_escapes_count=sum(
+                    cluster_statistics.local_optimum_escapes_count for cluster_statistics in statistics),
+                best_states_update_count=sum(
+                    cluster_statistics.best_states_update_count for cluster_statistics in statistics),
+                explored_states_count=sum(
+                    cluster_statistics.explored_states_count for cluster_statistics in statistics),
+                time_untill_optimum_found=self.total_time),
+            algorithm_config=algorithm.config)
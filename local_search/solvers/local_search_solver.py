@@ -4,6 +4,9 @@ from local_search.problems.base import Problem
 from local_search.solvers.solution import Solution
 from local_search.solvers.solver import Solver
 
+# part of the time limit that may be spent on the bound on the objective, the rest is left for the search
+BOUND_TIME_SHARE = 0.1
+
 
 class LocalSearchSolver(Solver):
     """
@@ -14,6 +17,9 @@ class LocalSearchSolver(Solver):
         statistics_subscription = algorithm.subscribe(
             self.algorithm_monitor, niceness=MIN_NICENCESS)
         self.start_timer()
+        bound = model.objective_bound(self._config.time_limit * BOUND_TIME_SHARE) \
+            if self._config.optimality_gap > 0 else None
+        checked_state = None
         solution_state = model.initial_state
         while not self.is_timeout():
             try:
@@ -26,6 +32,12 @@ class LocalSearchSolver(Solver):
             else:
                 solution_state = algorithm.best_state
                 break
+            # the gap changes only when the algorithm finds a better state
+            if bound is not None and algorithm.best_state is not checked_state:
+                checked_state = algorithm.best_state
+                if self._is_gap_closed(model, checked_state, bound):
+                    solution_state = checked_state
+                    break
 
         self.stop_timer()
         statistics = statistics_subscription.subscriber.statistics
@@ -35,3 +47,11 @@ class LocalSearchSolver(Solver):
             problem=model,
             statistics=statistics,
             algorithm_config=algorithm.config)
+
+    def _is_gap_closed(self, model: Problem, state, bound: float) -> bool:
+        """
+        Checks if objective of the state is within the configured percent of the bound
+        """
+        distance_to_bound = (model.objective_for(state) -
+                             bound) * -model.goal.type().value
+        return distance_to_bound <= self._config.optimality_gap / 100 * abs(bound)
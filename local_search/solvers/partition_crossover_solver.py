@@ -0,0 +1,152 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import ceil
+from typing import Dict, List, Tuple, Type, Union
+
+import numpy as np
+from local_search.algorithm_subscribers.algorithm_monitor import AlgorithmStatistics
+from local_search.algorithms.algorithm_config import AlgorithmConfig
+from local_search.algorithms.subscribable_algorithm import SubscribableAlgorithm
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.base import Problem
+from local_search.problems.traveling_salesman_problem.crossover import MIN_IMPROVEMENT, partition_crossover, \
+    tour_length
+from local_search.problems.traveling_salesman_problem.decomposition import cluster_arguments
+from local_search.problems.traveling_salesman_problem.problem import TOURS, TravelingSalesmanProblem
+from local_search.problems.traveling_salesman_problem.zobrist import route_hash
+from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.solution import Solution
+from local_search.solvers.solver import Solver
+from local_search.solvers.solver_config import SolverConfig
+
+# number of times the runs are started from the recombined tours
+ROUNDS = 3
+# part of the time of every round spent on recombining the tours, the rest is left for the runs
+RECOMBINATION_TIME_SHARE = 0.1
+
+
+def _closed_route(tour: np.ndarray, depot_idx: int) -> np.ndarray:
+    """
+    Rotates the tour so that it starts in the depot and comes back to it
+    """
+    depot_position = int(np.flatnonzero(tour == depot_idx)[0])
+    return np.concatenate((tour[depot_position:], tour[:depot_position + 1]))
+
+
+def _tour_hash(tour: np.ndarray) -> int:
+    return route_hash(np.append(tour, tour[:1]))
+
+
+def _run(coordinates: np.ndarray, problem_arguments: dict, route: Union[np.ndarray, None],
+         algorithm_type: Type[SubscribableAlgorithm], algorithm_config: AlgorithmConfig, time_limit: float,
+         seed: int) -> Tuple[np.ndarray, AlgorithmStatistics]:
+    """
+    Runs the algorithm from the route, or from a random state if there is no route, runs in a worker process
+    :returns: tour through the points of the best state and statistics of the algorithm
+    """
+    # worker processes start with the same state of the random generator as their parent
+    random.seed(seed)
+    problem = TravelingSalesmanProblem(coordinates, **problem_arguments)
+    if route is not None:
+        problem.initial_state = TOURS[problem.config.tour](
+            points=problem.points, route=route)
+    algorithm = algorithm_type(algorithm_config)
+    solution = LocalSearchSolver(SolverConfig(time_limit=time_limit)).solve(
+        problem, algorithm)
+    # when the time runs out, the solution has the current state, which may be worse than the best one
+    best_state = solution.state if algorithm.best_state is None else algorithm.best_state
+    return best_state.route[:-1], solution.statistics
+
+
+class PartitionCrossoverSolver(Solver):
+    """
+    Solver for traveling salesman problems that recombines tours found by many runs of the algorithm.
+
+    Runs are independent and work in separate processes. Tours they find are recombined with partition crossover
+    into shorter ones for as long as it improves them, and the best distinct tours make the elite.
+    The next round of runs starts from the elite tours.
+    """
+
+    def solve(self, model: Problem, algorithm: SubscribableAlgorithm) -> Solution:
+        if not isinstance(model, TravelingSalesmanProblem):
+            raise ValueError(
+                f'{type(self).__name__} solves only {TravelingSalesmanProblem.__name__}')
+        self.start_timer()
+        runs = self._config.runs
+        n_workers = max(min(os.cpu_count() or 1, runs), 1)
+        round_time_limit = self._time_limit / ROUNDS
+        run_time_limit = (1 - RECOMBINATION_TIME_SHARE) * \
+            round_time_limit / ceil(runs / n_workers)
+        problem_arguments = {
+            'depot_idx': model.depot_idx,
+            'move_generator_name': camel_to_snake(type(model.move_generator).__name__),
+            'goal_name': camel_to_snake(type(model.goal).__name__),
+            'config': model.config,
+            'has_coordinates': model.has_coordinates,
+            **cluster_arguments(model.distance_metric, model.distances, np.arange(len(model.points)))
+        }
+        elite: List[np.ndarray] = []
+        statistics: List[AlgorithmStatistics] = []
+        with ProcessPoolExecutor(n_workers) as executor:
+            for round_number in range(ROUNDS):
+                routes = [_closed_route(elite[run % len(elite)], model.depot_idx) if elite else None
+                          for run in range(runs)]
+                results = executor.map(_run,
+                                       [model.coordinates] * runs,
+                                       [problem_arguments] * runs,
+                                       routes,
+                                       [type(algorithm)] * runs,
+                                       [algorithm.config] * runs,
+                                       [run_time_limit] * runs,
+                                       [random.getrandbits(32) for _ in range(runs)])
+                tours = list(elite)
+                for tour, run_statistics in results:
+                    tours.append(tour)
+                    statistics.append(run_statistics)
+                elite = self._recombine(model, tours, runs,
+                                        self.start_time + (round_number + 1) * round_time_limit)
+        self.stop_timer()
+
+        state = TOURS[model.config.tour](
+            points=model.points, route=_closed_route(elite[0], model.depot_idx))
+        return Solution(
+            state=state,
+            problem=model,
+            statistics=AlgorithmStatistics(
+                algorithm_name=camel_to_snake(type(algorithm).__name__),
+                local_optimum_escapes_count=sum(
+                    run_statistics.local_optimum_escapes_count for run_statistics in statistics),
+                best_states_update_count=sum(
+                    run_statistics.best_states_update_count for run_statistics in statistics),
+                explored_states_count=sum(
+                    run_statistics.explored_states_count for run_statistics in statistics),
+                time_untill_optimum_found=self.total_time),
+            algorithm_config=algorithm.config)
+
+    def _recombine(self, model: TravelingSalesmanProblem, tours: List[np.ndarray], elite_size: int,
+                   deadline: float) -> List[np.ndarray]:
+        """
+        Recombines every pair of elite tours and keeps the best distinct tours, until no pair gives a new one
+        :returns: the elite, the shortest tour first
+        """
+        lengths: Dict[int, Tuple[float, np.ndarray]] = {}
+        for tour in tours:
+            lengths[_tour_hash(tour)] = (tour_length(model.distances, tour), tour)
+        elite = sorted(lengths.values(), key=lambda item: item[0])[:elite_size]
+        improved = True
+        while improved and time.time() < deadline:
+            improved = False
+            for (_, shorter), (longer_length, longer) in combinations(elite, 2):
+                offspring = partition_crossover(model.distances, shorter, longer)
+                offspring_length = tour_length(model.distances, offspring)
+                offspring_hash = _tour_hash(offspring)
+                if offspring_length < longer_length - MIN_IMPROVEMENT and offspring_hash not in lengths:
+                    lengths[offspring_hash] = (offspring_length, offspring)
+                    improved = True
+                if time.time() >= deadline:
+                    break
+            elite = sorted(lengths.values(), key=lambda item: item[0])[:elite_size]
+        return [tour for _, tour in elite]
@@ -26,14 +26,14 @@ class Solution:
 
     def to_json(self, path: Path):
         with open(path, 'w+') as target:
-            json.dump(self.to_dict(), target, indent=4)
+            json.dump(self.to_dict(), target, separators=(',', ':'))
 
     @staticmethod
     def from_json(path: Path):
         with open(path) as source:
             data = json.load(source)
             problem = Problem.from_dict(data["problem"])
-            state = State.from_dict(data["state"])
+            state = State.from_dict(data["state"], problem)
             statistics = AlgorithmStatistics.from_dict(data["statistics"])
             config_type = get_type_for_param(
                 SubscribableAlgorithm.algorithms[statistics.algorithm_name], 'config')
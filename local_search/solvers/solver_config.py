@@ -5,3 +5,10 @@ from dataclasses import dataclass
 class SolverConfig:
     time_limit: int = 60
     show_statistics: bool = False
+    # percent by which the best state may be worse than the bound on the objective when solver stops, 0 disables it
+    optimality_gap: float = 0
+    # number of clusters solved separately by ClusterDecompositionSolver, 0 means that the problem isn't split
+    clusters: int = 0
+    clustering: str = 'kmeans'
+    # number of runs of the algorithm whose tours are recombined by PartitionCrossoverSolver, 0 means a single run
+    runs: int = 0